@@ -0,0 +1,120 @@
+# src/cached_embeddings.py
+"""
+Embedding helpers: a process-wide local model cache and a wrapper that
+remembers recent query vectors and skips duplicate documents.
+"""
+from functools import lru_cache
+from typing import List, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from constants import (
+    DEFAULT_DEVICE,
+    EMBEDDING_DEVICE_AUTO,
+    QUERY_EMBEDDING_CACHE_SIZE,
+)
+
+
+def _resolve_device(device: str) -> str:
+    """
+    Turn the configured device into a torch device name.
+
+    Args:
+            device: Configured device, or "auto"
+
+    Returns:
+            For "auto", "cuda" or "mps" when that GPU is available and the CPU
+            device otherwise; any other value is passed through unchanged
+    """
+    if device != EMBEDDING_DEVICE_AUTO:
+        return device
+
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return DEFAULT_DEVICE
+
+
+@lru_cache(maxsize=None)
+def load_local_embeddings(model_name: str, device: str) -> Embeddings:
+    """
+    Load a local HuggingFace embedding model once per process.
+
+    Loading the model weights is the slowest part of startup, so every
+    assistant and container in the process shares one instance per model.
+
+    Args:
+            model_name: sentence-transformers model name
+            device: Torch device to run on, or "auto"
+
+    Returns:
+            HuggingFaceEmbeddings instance
+    """
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+
+    resolved_device = _resolve_device(device)
+    print(f"Embedding device: {resolved_device}")
+    return HuggingFaceEmbeddings(
+        model_name=model_name, model_kwargs={"device": resolved_device}
+    )
+
+
+class QueryCachedEmbeddings(Embeddings):
+    """
+    Delegates to another embeddings instance, caching embed_query results and
+    embedding repeated document texts only once per call.
+    """
+
+    def __init__(self, embeddings: Embeddings):
+        """
+        Wrap an embeddings instance.
+
+        Args:
+                embeddings: Embeddings used for the actual computation
+        """
+        self.embeddings = embeddings
+        # Per instance, so the cache is released with the wrapper
+        self._embed_query_cached = lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(
+            self._embed_query_tuple
+        )
+
+    def _embed_query_tuple(self, text: str) -> Tuple[float, ...]:
+        """Embed a query as an immutable tuple so it can be cached safely"""
+        return tuple(self.embeddings.embed_query(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed documents (not cached across calls).
+
+        Boilerplate such as shared headers splits into identical chunks, so
+        each distinct text is embedded once and its vector reused.
+
+        Args:
+                texts: Texts to embed
+
+        Returns:
+                One vector per text
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) == len(texts):
+            return self.embeddings.embed_documents(texts)
+
+        vectors = dict(
+            zip(unique_texts, self.embeddings.embed_documents(unique_texts))
+        )
+        return [list(vectors[text]) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        """
+        Embed a query, reusing the vector if the same text was embedded recently.
+
+        Args:
+                text: Query text
+
+        Returns:
+                Query vector
+        """
+        return list(self._embed_query_cached(text))
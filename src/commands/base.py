@@ -3,11 +3,12 @@
 Base command interface and context for the command pattern.
 """
 from abc import ABC, abstractmethod
+from html import escape
 from typing import Any
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandContext:
 	"""
 	Context object passed to all commands containing necessary dependencies.
@@ -27,8 +28,12 @@ class Command(ABC):
 	Abstract base class for all commands.
 	
 	All commands should inherit from this class and implement the execute method.
+	Commands return plain text; presentation for the web is applied by format_for_html.
 	"""
 	
+	# Whether the result should be displayed as preformatted text on the web
+	preformatted = True
+	
 	@abstractmethod
 	def execute(self, context: CommandContext) -> str:
 		"""
@@ -45,6 +50,21 @@ class Command(ABC):
 		"""
 		pass
 	
+	def format_for_html(self, result: str) -> str:
+		"""
+		Format command result for display in the web interface.
+		
+		Args:
+			result: The command result string
+			
+		Returns:
+			Result wrapped in an escaped <pre> block if the command is preformatted,
+			otherwise the result unchanged
+		"""
+		if not self.preformatted:
+			return result
+		return f"<pre>{escape(result, quote=False)}</pre>"
+	
 	def format_for_web(self, result: str, command_type: str = "success") -> dict:
 		"""
 		Format command result for web API response.
@@ -2,7 +2,8 @@
 """
 Command parser for converting user input into Command objects.
 """
-from typing import Optional
+import re
+from typing import Callable, Dict, Optional, Type
 from .base import Command, InvalidCommandError
 from .project_commands import (
     ProjectInfoCommand,
@@ -22,12 +23,32 @@ from constants import (
     COMMAND_CLEAR,
 )
 
+# Splits command text into the command word and its (left-stripped) arguments
+_COMMAND_RE = re.compile(r"(\S+)\s*(.*)", re.DOTALL)
+
 
 class CommandParser:
     """
     Parses user input and returns appropriate Command objects.
     """
 
+    def __init__(self):
+        """Build the command dispatch tables."""
+        # Top-level command word -> handler receiving the argument text
+        self._dispatch: Dict[str, Callable[[str], Command]] = {
+            COMMAND_PROJECT: self._parse_project_command,
+            COMMAND_READ: self._parse_read_command,
+            COMMAND_LIST: self._parse_list_command,
+            COMMAND_LORE: lambda args: LoreStatusCommand(),
+            COMMAND_CLEAR: lambda args: ClearContextCommand(),
+        }
+
+        # /project subcommand -> command class
+        self._project_dispatch: Dict[str, Type[Command]] = {
+            "info": ProjectInfoCommand,
+            "structure": ProjectStructureCommand,
+        }
+
     def parse(self, input_text: str) -> Optional[Command]:
         """
         Parse user input and return a Command object if it's a valid command.
@@ -47,57 +68,35 @@ class CommandParser:
         if not text.startswith(COMMAND_PREFIX):
             return None
 
-        # Parse /project commands
-        if text.startswith(COMMAND_PROJECT):
-            return self._parse_project_command(text)
-
-        # Parse /read command
-        if text.startswith(COMMAND_READ):
-            return self._parse_read_command(text)
-
-        # Parse /list command
-        if text.startswith(COMMAND_LIST):
-            return self._parse_list_command(text)
-
-        # Parse /lore command
-        if text.startswith(COMMAND_LORE):
-            return LoreStatusCommand()
-
-        # Parse /clear command
-        if text.startswith(COMMAND_CLEAR):
-            return ClearContextCommand()
+        head, args = _COMMAND_RE.match(text).groups()
+        handler = self._dispatch.get(head)
 
         # Unknown command
-        raise InvalidCommandError(f"Unknown command: {text.split()[0]}")
+        if handler is None:
+            raise InvalidCommandError(f"Unknown command: {head}")
 
-    def _parse_project_command(self, text: str) -> Command:
+        return handler(args)
+
+    def _parse_project_command(self, args: str) -> Command:
         """
         Parse /project subcommands.
 
         Args:
-                text: Command text starting with /project
+                args: Text following /project
 
         Returns:
-                Appropriate project command
-
-        Raises:
-                InvalidCommandError: If subcommand is invalid
+                Appropriate project command, or HelpCommand if subcommand is unknown
         """
-        text_lower = text.lower()
+        subcommand = args.strip().partition(" ")[0].lower()
+        command_class = self._project_dispatch.get(subcommand, HelpCommand)
+        return command_class()
 
-        if "info" in text_lower:
-            return ProjectInfoCommand()
-        elif "structure" in text_lower:
-            return ProjectStructureCommand()
-        else:
-            return HelpCommand()
-
-    def _parse_read_command(self, text: str) -> Command:
+    def _parse_read_command(self, args: str) -> Command:
         """
         Parse /read command.
 
         Args:
-                text: Command text starting with /read
+                args: Text following /read
 
         Returns:
                 ReadFileCommand with the specified file path
@@ -105,31 +104,29 @@ class CommandParser:
         Raises:
                 InvalidCommandError: If no file path provided
         """
-        parts = text.split(maxsplit=1)
+        file_path = args.strip()
 
-        if len(parts) < 2 or not parts[1].strip():
+        if not file_path:
             raise InvalidCommandError("/read requires a file path. Usage: /read <file>")
 
-        file_path = parts[1].strip()
         return ReadFileCommand(file_path)
 
-    def _parse_list_command(self, text: str) -> Command:
+    def _parse_list_command(self, args: str) -> Command:
         """
         Parse /list command.
 
         Args:
-                text: Command text starting with /list
+                args: Text following /list
 
         Returns:
                 ListFilesCommand with the specified pattern (or default)
         """
-        parts = text.split(maxsplit=1)
+        pattern = args.strip()
 
-        if len(parts) < 2 or not parts[1].strip():
+        if not pattern:
             # Use default pattern
             return ListFilesCommand()
 
-        pattern = parts[1].strip()
         return ListFilesCommand(pattern)
 
     def is_command(self, input_text: str) -> bool:
@@ -142,7 +139,11 @@ class CommandParser:
         Returns:
                 True if input is a command, False otherwise
         """
-        return input_text.strip().startswith("/")
+        return input_text.lstrip()[:1] == COMMAND_PREFIX
+
+
+# Shared parser instance used by the convenience function below
+_PARSER = CommandParser()
 
 
 # Convenience function for quick parsing
@@ -159,5 +160,4 @@ def parse_command(input_text: str) -> Optional[Command]:
     Raises:
             InvalidCommandError: If command syntax is invalid
     """
-    parser = CommandParser()
-    return parser.parse(input_text)
+    return _PARSER.parse(input_text)
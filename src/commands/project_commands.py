@@ -1,10 +1,23 @@
 # src/commands/project_commands.py
+import os
+from itertools import islice
 from .base import Command, CommandContext
+from text_files import scan_files
 from constants import (
+    LORE_FILE_EXTENSIONS,
     MAX_FILES_IN_LIST,
     MAX_FILE_CONTENT_DISPLAY,
+    SEPARATOR_LINE,
 )
 
+_HELP_TEXT = """Available Commands:
+- /project info      - Show project information
+- /project structure - Show project file structure
+- /read <file>       - Read a specific file (loads into context)
+- /list [pattern]    - List files (default: *.gd)
+- /lore              - Show lore files status
+- /clear             - Clear loaded file context"""
+
 
 class ProjectInfoCommand(Command):
     """Display project information"""
@@ -20,7 +33,7 @@ class ProjectInfoCommand(Command):
                 Formatted project information string
         """
         info = context.project_analyzer.get_project_info()
-        return f"<pre>{info}</pre>"
+        return info
 
 
 class ProjectStructureCommand(Command):
@@ -37,7 +50,7 @@ class ProjectStructureCommand(Command):
                 Formatted project structure string
         """
         structure = context.project_analyzer.get_project_structure()
-        return f"<pre>{structure}</pre>"
+        return structure
 
 
 class ListFilesCommand(Command):
@@ -70,11 +83,11 @@ class ListFilesCommand(Command):
         if not files:
             raise ValueError(f"No files found matching: {self.pattern}")
 
-        file_list = "\n".join([f"  {f}" for f in files[:MAX_FILES_IN_LIST]])
-        if len(files) > 50:
-            file_list += f"\n\n... and {len(files) - 50} more"
+        file_list = "\n".join(f"  {f}" for f in islice(files, MAX_FILES_IN_LIST))
+        if len(files) > MAX_FILES_IN_LIST:
+            file_list += f"\n\n... and {len(files) - MAX_FILES_IN_LIST} more"
 
-        return f"<pre>📁 Files matching '{self.pattern}':\n{'='*80}\n{file_list}\n{'='*80}</pre>"
+        return f"📁 Files matching '{self.pattern}':\n{SEPARATOR_LINE}\n{file_list}\n{SEPARATOR_LINE}"
 
 
 class ReadFileCommand(Command):
@@ -104,7 +117,14 @@ class ReadFileCommand(Command):
         """
         from .base import FileNotFoundError as CmdFileNotFoundError
 
-        content = context.project_analyzer.read_file(self.file_path)
+        if context.assistant:
+            # Full content is kept as context for follow-up questions
+            content = context.project_analyzer.read_file(self.file_path)
+        else:
+            # Display only - no need to load more than is shown
+            content = context.project_analyzer.read_file_head(
+                self.file_path, MAX_FILE_CONTENT_DISPLAY
+            )
 
         if content is None:
             raise CmdFileNotFoundError(f"File not found: {self.file_path}")
@@ -119,17 +139,20 @@ class ReadFileCommand(Command):
         # Limit display for web/console
         display_content = content[:MAX_FILE_CONTENT_DISPLAY]
         if len(content) > MAX_FILE_CONTENT_DISPLAY:
-            display_content += (
-                f"\n\n... (showing first 3000 chars of {len(content)} total)"
-            )
+            if context.assistant:
+                display_content += f"\n\n... (showing first {MAX_FILE_CONTENT_DISPLAY} chars of {len(content)} total)"
+            else:
+                display_content += (
+                    f"\n\n... (showing first {MAX_FILE_CONTENT_DISPLAY} chars)"
+                )
 
-        result = f"""<pre>📄 Contents of {self.file_path}:
-{'='*80}
+        result = f"""📄 Contents of {self.file_path}:
+{SEPARATOR_LINE}
 {display_content}
-{'='*80}
+{SEPARATOR_LINE}
 
 ✓ File loaded into context! You can now ask questions about this file.
-Use /clear to remove file context.</pre>"""
+Use /clear to remove file context."""
 
         return result
 
@@ -137,6 +160,8 @@ Use /clear to remove file context.</pre>"""
 class ClearContextCommand(Command):
     """Clear the loaded file context"""
 
+    preformatted = False
+
     def execute(self, context: CommandContext) -> str:
         """
         Clear the last read file from context.
@@ -150,6 +175,8 @@ class ClearContextCommand(Command):
         if context.assistant and context.assistant.last_read_file:
             file_path = context.assistant.last_read_file["path"]
             context.assistant.last_read_file = None
+            # Free the chunks and vectors kept for the file's excerpts
+            context.assistant._file_chunks = None
             return f"✓ Cleared file context for: {file_path}"
         else:
             return "No file context to clear."
@@ -172,7 +199,7 @@ class LoreStatusCommand(Command):
             return "Assistant not available"
 
         lore_path = context.assistant.config.paths.lore_path
-        result = ["Lore Status:", "=" * 80]
+        result = ["Lore Status:", SEPARATOR_LINE]
 
         if not lore_path.exists():
             result.append(f"❌ Lore directory not found: {lore_path}")
@@ -180,23 +207,20 @@ class LoreStatusCommand(Command):
         else:
             result.append(f"✓ Lore directory: {lore_path}")
 
-            lore_files = []
-            for pattern in ["*.txt", "*.md", "*.rst"]:
-                lore_files.extend(list(lore_path.rglob(pattern)))
+            lore_files = sorted(scan_files(str(lore_path), LORE_FILE_EXTENSIONS))
 
             if lore_files:
                 result.append(f"✓ Found {len(lore_files)} lore files:")
-                for f in lore_files:
-                    rel_path = f.relative_to(lore_path)
-                    size = f.stat().st_size
-                    result.append(f"  - {rel_path} ({size:,} bytes)")
+                for path, stat in lore_files:
+                    rel_path = os.path.relpath(path, lore_path)
+                    result.append(f"  - {rel_path} ({stat.st_size:,} bytes)")
             else:
                 result.append("⚠ No lore files found")
                 result.append("Add .txt, .md, or .rst files to the lore directory")
 
-        result.append("=" * 80)
+        result.append(SEPARATOR_LINE)
 
-        return f"<pre>{chr(10).join(result)}</pre>"
+        return "\n".join(result)
 
 
 class HelpCommand(Command):
@@ -212,12 +236,4 @@ class HelpCommand(Command):
         Returns:
                 Formatted help text
         """
-        help_text = """Available Commands:
-- /project info      - Show project information
-- /project structure - Show project file structure
-- /read <file>       - Read a specific file (loads into context)
-- /list [pattern]    - List files (default: *.gd)
-- /lore              - Show lore files status
-- /clear             - Clear loaded file context"""
-
-        return f"<pre>{help_text}</pre>"
+        return _HELP_TEXT
@@ -5,16 +5,29 @@ Handles all environment variables and application settings.
 """
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
-from dotenv import load_dotenv
-from constants import ENV_API_PROVIDER, API_PROVIDER_ANTHROPIC
+from constants import (
+    DEFAULT_EMBEDDING_BATCH_SIZE,
+    DEFAULT_EMBEDDING_MODEL,
+    DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+    EMBEDDING_DEVICE_AUTO,
+    ENV_API_PROVIDER,
+    ENV_LOCAL_EMBEDDING_MODEL,
+    ENV_RAG_EMBEDDING_BATCH_SIZE,
+    ENV_RAG_SEARCH_TYPE,
+    ENV_RAG_SEMANTIC_CACHE_THRESHOLD,
+    API_PROVIDER_ANTHROPIC,
+    SEARCH_TYPE_SIMILARITY,
+    SEPARATOR_LINE,
+    VALID_API_PROVIDERS,
+    VALID_EMBEDDING_PROVIDERS,
+    VALID_SEARCH_TYPES,
+)
 import os
 
-# Load environment variables from .env file
-load_dotenv()
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """Configuration for API providers (Anthropic/OpenAI)"""
 
@@ -45,23 +58,29 @@ class APIConfig:
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
         if self.provider == "openai" and not self.openai_key:
             raise ValueError("OPENAI_API_KEY not found in environment")
-        if self.provider not in ["anthropic", "openai"]:
+        if self.provider not in VALID_API_PROVIDERS:
             raise ValueError(
                 f"Invalid API_PROVIDER: {self.provider}. Must be 'anthropic' or 'openai'"
             )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EmbeddingConfig:
     """Configuration for embedding providers"""
 
     provider: str
+    local_model: str
+    device: str
 
     @classmethod
     def from_env(cls) -> "EmbeddingConfig":
         """Create embedding configuration from environment variables"""
         provider = os.getenv("EMBEDDING_PROVIDER", "local").lower()
-        return cls(provider=provider)
+        return cls(
+            provider=provider,
+            local_model=os.getenv(ENV_LOCAL_EMBEDDING_MODEL, DEFAULT_EMBEDDING_MODEL),
+            device=os.getenv("EMBEDDING_DEVICE", EMBEDDING_DEVICE_AUTO).lower(),
+        )
 
     def validate(self) -> None:
         """
@@ -70,7 +89,7 @@ class EmbeddingConfig:
         Raises:
                 ValueError: If provider is invalid
         """
-        if self.provider not in ["local", "openai"]:
+        if self.provider not in VALID_EMBEDDING_PROVIDERS:
             raise ValueError(
                 f"Invalid EMBEDDING_PROVIDER: {self.provider}. Must be 'local' or 'openai'"
             )
@@ -79,7 +98,7 @@ class EmbeddingConfig:
             raise ValueError("OPENAI_API_KEY required for OpenAI embeddings")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PathConfig:
     """Configuration for application paths"""
 
@@ -87,6 +106,8 @@ class PathConfig:
     docs_path: Path
     lore_path: Path
     db_path: Path
+    embedding_cache_path: Path
+    qa_cache_path: Path
 
     @classmethod
     def from_env(cls) -> "PathConfig":
@@ -96,6 +117,8 @@ class PathConfig:
             docs_path=Path("/app/godot_docs"),
             lore_path=Path("/app/data/lore"),
             db_path=Path("/app/data/chroma_db"),
+            embedding_cache_path=Path("/app/data/embedding_cache"),
+            qa_cache_path=Path("/app/data/qa_cache"),
         )
 
     def ensure_directories(self) -> None:
@@ -104,13 +127,16 @@ class PathConfig:
         self.db_path.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RAGConfig:
     """Configuration for RAG (Retrieval Augmented Generation) settings"""
 
     chunk_size: int
     chunk_overlap: int
     retrieval_k: int
+    search_type: str
+    embedding_batch_size: int
+    semantic_cache_threshold: float
 
     @classmethod
     def default(cls) -> "RAGConfig":
@@ -119,10 +145,42 @@ class RAGConfig:
             chunk_size=int(os.getenv("RAG_CHUNK_SIZE", "1000")),
             chunk_overlap=int(os.getenv("RAG_CHUNK_OVERLAP", "200")),
             retrieval_k=int(os.getenv("RAG_RETRIEVAL_K", "6")),
+            search_type=os.getenv(ENV_RAG_SEARCH_TYPE, SEARCH_TYPE_SIMILARITY).lower(),
+            embedding_batch_size=int(
+                os.getenv(ENV_RAG_EMBEDDING_BATCH_SIZE, DEFAULT_EMBEDDING_BATCH_SIZE)
+            ),
+            semantic_cache_threshold=float(
+                os.getenv(
+                    ENV_RAG_SEMANTIC_CACHE_THRESHOLD, DEFAULT_SEMANTIC_CACHE_THRESHOLD
+                )
+            ),
         )
 
+    def validate(self) -> None:
+        """
+        Validate RAG settings.
+
+        Raises:
+                ValueError: If the search type, batch size or cache threshold is invalid
+        """
+        if self.search_type not in VALID_SEARCH_TYPES:
+            raise ValueError(
+                f"Invalid RAG_SEARCH_TYPE: {self.search_type}. "
+                "Must be 'similarity' or 'mmr'"
+            )
+        if self.embedding_batch_size < 1:
+            raise ValueError(
+                f"Invalid RAG_EMBEDDING_BATCH_SIZE: {self.embedding_batch_size}. "
+                "Must be at least 1"
+            )
+        if not 0 <= self.semantic_cache_threshold <= 1:
+            raise ValueError(
+                "Invalid RAG_SEMANTIC_CACHE_THRESHOLD: "
+                f"{self.semantic_cache_threshold}. Must be between 0 (disabled) and 1"
+            )
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     """Configuration for LLM models"""
 
@@ -140,7 +198,7 @@ class LLMConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WebConfig:
     """Configuration for web application"""
 
@@ -158,7 +216,7 @@ class WebConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Main application configuration container"""
 
@@ -181,6 +239,11 @@ class AppConfig:
         Raises:
                 ValueError: If any configuration is invalid
         """
+        # Load environment variables from .env file (deferred until needed)
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
         api_config = APIConfig.from_env()
         api_config.validate()
 
@@ -190,11 +253,14 @@ class AppConfig:
         paths_config = PathConfig.from_env()
         paths_config.ensure_directories()
 
+        rag_config = RAGConfig.default()
+        rag_config.validate()
+
         return cls(
             api=api_config,
             embedding=embedding_config,
             paths=paths_config,
-            rag=RAGConfig.default(),
+            rag=rag_config,
             llm=LLMConfig.default(),
             web=WebConfig.from_env(),
             language=os.getenv("LANGUAGE", "en"),
@@ -202,20 +268,24 @@ class AppConfig:
 
     def print_summary(self) -> None:
         """Print a summary of the current configuration"""
-        print("\n" + "=" * 80)
+        print("\n" + SEPARATOR_LINE)
         print("Configuration Summary")
-        print("=" * 80)
+        print(SEPARATOR_LINE)
         print(f"API Provider: {self.api.provider.upper()}")
         print(f"Embedding Provider: {self.embedding.provider.upper()}")
+        if self.embedding.provider == "local":
+            print(f"Embedding Model: {self.embedding.local_model}")
+            print(f"Embedding Device: {self.embedding.device}")
         print(f"LLM Model: {self.get_model_name()}")
         print(f"Project Path: {self.paths.project_path}")
         print(f"Docs Path: {self.paths.docs_path}")
         print(f"Lore Path: {self.paths.lore_path}")
         print(f"Database Path: {self.paths.db_path}")
         print(
-            f"RAG Settings: chunk_size={self.rag.chunk_size}, k={self.rag.retrieval_k}"
+            f"RAG Settings: chunk_size={self.rag.chunk_size}, "
+            f"k={self.rag.retrieval_k}, search={self.rag.search_type}"
         )
-        print("=" * 80 + "\n")
+        print(SEPARATOR_LINE + "\n")
 
     def get_model_name(self) -> str:
         """Get the active model name based on API provider"""
@@ -226,10 +296,15 @@ class AppConfig:
 
 
 # Convenience function for quick access
+@lru_cache(maxsize=None)
 def load_config() -> AppConfig:
     """
     Load and validate application configuration.
 
+    The configuration is read from the environment once and cached for the
+    lifetime of the process. Use reload_config() to force a fresh read, or
+    load_config.cache_clear() to read it again on the next call.
+
     Returns:
             AppConfig: Validated application configuration
 
@@ -239,6 +314,22 @@ def load_config() -> AppConfig:
     return AppConfig.from_env()
 
 
+def reload_config() -> AppConfig:
+    """
+    Discard the cached configuration and load it again from the environment.
+
+    Useful for testing or after changing environment variables.
+
+    Returns:
+            AppConfig: Freshly loaded application configuration
+
+    Raises:
+            ValueError: If configuration is invalid
+    """
+    load_config.cache_clear()
+    return load_config()
+
+
 # Example usage demonstration
 if __name__ == "__main__":
     try:
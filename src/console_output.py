@@ -1,6 +1,6 @@
 # src/console_output.py
-import os
-from project_analyzer import ProjectAnalyzer
+import sys
+from typing import TYPE_CHECKING
 from constants import (
     APP_TITLE,
     APP_VERSION,
@@ -8,8 +8,43 @@ from constants import (
     COLOR_OK,
     COLOR_END,
     COLOR_ERROR,
+    CLEAR_SCREEN,
+    SEPARATOR_LINE,
 )
 
+if TYPE_CHECKING:
+    from project_analyzer import ProjectAnalyzer
+
+# Static console text, built once at import time
+_TITLE_TEXT = f"""{SEPARATOR_LINE}
+{COLOR_OK}
+{APP_TITLE}
+Version: {APP_VERSION}
+{COLOR_END}
+{APP_DESCRIPTION}
+{SEPARATOR_LINE}"""
+
+_GOODBYE_TEXT = f"{COLOR_OK}\n\nGoodbye!{COLOR_END}"
+
+_PROJECT_STATUS_HEADER = (
+    f"\n{SEPARATOR_LINE}\n{COLOR_OK}Project Status:{COLOR_END}\n{SEPARATOR_LINE}"
+)
+
+_WELCOME_TEXT = f"""
+{SEPARATOR_LINE}
+{COLOR_OK}Assistant ready! Ask me anything about Godot development or your game lore.{COLOR_END}
+
+Special Commands:
+  /project info      - Show your project details
+  /project structure - Show project file tree
+  /read <file>       - Read a file from your project (loads into context)
+  /list [pattern]    - List files (e.g., /list *.gd)
+  /lore              - Show lore files status
+  /clear             - Clear loaded file context
+  quit or exit       - Exit the assistant
+{SEPARATOR_LINE}
+"""
+
 
 class ConsoleOutputManager:
     """Manages console output and formatting for the Godot AI Development Assistant."""
@@ -51,47 +86,25 @@ You can:
 
     def print_goodbye_message(self) -> None:
         """Print a goodbye message when the user exits the application."""
-        print(f"{COLOR_OK}\n\nGoodbye!{COLOR_END}")
+        print(_GOODBYE_TEXT)
 
-    def print_project_status(self, analyzer: ProjectAnalyzer) -> None:
+    def print_project_status(self, analyzer: "ProjectAnalyzer") -> None:
         """
         Print detailed project status information.
 
         Args:
                 analyzer: ProjectAnalyzer instance containing project information
         """
-        print("\n" + "=" * 80)
-        print(COLOR_OK + "Project Status:" + COLOR_END)
-        print("=" * 80)
+        print(_PROJECT_STATUS_HEADER)
         print(analyzer.get_project_info())
-        print("=" * 80)
+        print(SEPARATOR_LINE)
 
     def print_title(self) -> None:
         """Print the application title with colored formatting."""
-        print("=" * 80)
-        print(COLOR_OK)
-        print(APP_TITLE)
-        print("Version:", APP_VERSION)
-        print(COLOR_END)
-        print(APP_DESCRIPTION)
-        print("=" * 80)
+        print(_TITLE_TEXT)
 
     def print_welcome_message(self) -> None:
         """Clear the screen and display the welcome message with available commands."""
-        os.system("clear")
-        separator = "=" * 80
-        welcome_text = f"""
-{separator}
-{COLOR_OK}Assistant ready! Ask me anything about Godot development or your game lore.{COLOR_END}
-
-Special Commands:
-  /project info      - Show your project details
-  /project structure - Show project file tree
-  /read <file>       - Read a file from your project (loads into context)
-  /list [pattern]    - List files (e.g., /list *.gd)
-  /lore              - Show lore files status
-  /clear             - Clear loaded file context
-  quit or exit       - Exit the assistant
-{separator}
-		"""
-        print(welcome_text)
+        if sys.stdout.isatty():
+            sys.stdout.write(CLEAR_SCREEN)
+        print(_WELCOME_TEXT)
@@ -3,6 +3,7 @@
 Centralized constants for Godot AI Development Assistant.
 All magic strings, numbers, and configuration defaults are defined here.
 """
+import os
 from pathlib import Path
 
 # =============================================================================
@@ -17,18 +18,24 @@ APP_DESCRIPTION = "An AI assistant for Godot game development."
 # =============================================================================
 API_PROVIDER_ANTHROPIC = "anthropic"
 API_PROVIDER_OPENAI = "openai"
+VALID_API_PROVIDERS = frozenset({API_PROVIDER_ANTHROPIC, API_PROVIDER_OPENAI})
 
 # =============================================================================
 # Embedding Configuration Constants
 # =============================================================================
 EMBEDDING_PROVIDER_LOCAL = "local"
 EMBEDDING_PROVIDER_OPENAI = "openai"
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+VALID_EMBEDDING_PROVIDERS = frozenset(
+    {EMBEDDING_PROVIDER_LOCAL, EMBEDDING_PROVIDER_OPENAI}
+)
 
 # =============================================================================
 # LLM Configuration
 # =============================================================================
 DEFAULT_LLM_TEMPERATURE = 0
 DEFAULT_DEVICE = "cpu"
+EMBEDDING_DEVICE_AUTO = "auto"  # GPU when available, otherwise DEFAULT_DEVICE
 
 # =============================================================================
 # RAG Configuration Constants
@@ -36,6 +43,25 @@ DEFAULT_DEVICE = "cpu"
 DEFAULT_CHUNK_SIZE = 1000
 DEFAULT_CHUNK_OVERLAP = 200
 DEFAULT_RETRIEVAL_K = 6
+SEARCH_TYPE_SIMILARITY = "similarity"
+SEARCH_TYPE_MMR = "mmr"
+VALID_SEARCH_TYPES = frozenset({SEARCH_TYPE_SIMILARITY, SEARCH_TYPE_MMR})
+DEFAULT_EMBEDDING_BATCH_SIZE = 512
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = 0.97
+QA_CACHE_COLLECTION = "qa_cache"
+# HNSW index settings for newly built databases; Chroma fixes them when the
+# collection is created. search_ef is raised well above the default of 10
+# so k=6 searches keep their recall.
+VECTORSTORE_HNSW_METADATA = {
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+    "hnsw:search_ef": 64,
+}
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+# Written into the database directory after ingestion (not a dotfile, so
+# clearing the directory with rm -rf chroma_db/* removes it too)
+DB_STATS_FILE = "ingest_stats.json"
+DB_MANIFEST_FILE = "ingest_manifest.json"
 
 # =============================================================================
 # File Extensions
@@ -44,6 +70,8 @@ GODOT_SCRIPT_EXTENSION = "*.gd"
 GODOT_SCENE_EXTENSION = "*.tscn"
 GODOT_RESOURCE_EXTENSION = "*.tres"
 GODOT_PROJECT_FILE = "project.godot"
+LORE_FILE_EXTENSIONS = frozenset({".txt", ".md", ".rst"})
+DOC_FILE_EXTENSIONS = frozenset({".rst"})  # Godot docs are in reStructuredText
 
 # =============================================================================
 # Console Output Colors
@@ -51,6 +79,7 @@ GODOT_PROJECT_FILE = "project.godot"
 COLOR_OK = "\033[92m"  # Green
 COLOR_END = "\033[0m"  # End color span
 COLOR_ERROR = "\033[96m"  # Cyan
+CLEAR_SCREEN = "\033[2J\033[H"  # Clear screen and move cursor home
 
 # =============================================================================
 # Display Limits
@@ -75,7 +104,7 @@ COMMAND_CLEAR = "/clear"
 # =============================================================================
 # Exit Commands
 # =============================================================================
-# EXIT_COMMANDS = ["quit", "exit", "q"]
+EXIT_COMMANDS = frozenset({"quit", "exit", "q"})
 
 # =============================================================================
 # Metadata Keys
@@ -83,6 +112,7 @@ COMMAND_CLEAR = "/clear"
 METADATA_SOURCE_TYPE = "source_type"
 SOURCE_TYPE_DOCUMENTATION = "documentation"
 SOURCE_TYPE_LORE = "lore"
+METADATA_ANSWER = "answer"
 
 # =============================================================================
 # Separator Characters
@@ -97,6 +127,8 @@ ENV_API_PROVIDER = "API_PROVIDER"
 ENV_ANTHROPIC_KEY = "ANTHROPIC_API_KEY"
 ENV_OPENAI_KEY = "OPENAI_API_KEY"
 ENV_EMBEDDING_PROVIDER = "EMBEDDING_PROVIDER"
+ENV_LOCAL_EMBEDDING_MODEL = "LOCAL_EMBEDDING_MODEL"
+ENV_EMBEDDING_DEVICE = "EMBEDDING_DEVICE"
 ENV_GODOT_PROJECT_PATH = "GODOT_PROJECT_PATH"
 ENV_ANTHROPIC_MODEL = "ANTHROPIC_MODEL"
 ENV_OPENAI_MODEL = "OPENAI_MODEL"
@@ -104,6 +136,9 @@ ENV_LLM_TEMPERATURE = "LLM_TEMPERATURE"
 ENV_RAG_CHUNK_SIZE = "RAG_CHUNK_SIZE"
 ENV_RAG_CHUNK_OVERLAP = "RAG_CHUNK_OVERLAP"
 ENV_RAG_RETRIEVAL_K = "RAG_RETRIEVAL_K"
+ENV_RAG_SEARCH_TYPE = "RAG_SEARCH_TYPE"
+ENV_RAG_EMBEDDING_BATCH_SIZE = "RAG_EMBEDDING_BATCH_SIZE"
+ENV_RAG_SEMANTIC_CACHE_THRESHOLD = "RAG_SEMANTIC_CACHE_THRESHOLD"
 ENV_WEB_HOST = "WEB_HOST"
 ENV_WEB_PORT = "WEB_PORT"
 ENV_WEB_DEBUG = "WEB_DEBUG"
@@ -113,8 +148,36 @@ ENV_LANGUAGE = "LANGUAGE"
 # LangChain Configuration
 # =============================================================================
 CHAIN_TYPE_STUFF = "stuff"
-LENGTH_FUNCTION = len
-QA_PROMPT_INPUT_VARIABLES = ["context", "question"]
+QA_PROMPT_INPUT_VARIABLES = ("context", "question")
+QA_PROMPT_TEMPLATE = """You are an expert Godot game engine assistant with access to:
+1. Official Godot documentation
+2. Game/project lore and world-building documents
+3. The user's actual project files
+
+IMPORTANT CAPABILITIES:
+- You can read files from the user's project by asking them to share specific file paths
+- You can see the project structure when provided
+- You have access to lore documents that describe the game's world, characters, story, and setting
+- You should provide advice tailored to their specific project when relevant
+
+When answering questions about lore, story, characters, or world-building:
+- Use the lore documents provided in the context
+- Be specific and reference details from the lore
+- Help maintain consistency with established lore
+
+When answering technical Godot questions:
+- Use the Godot documentation in the context
+- Provide specific code examples using GDScript syntax
+- Reference best practices
+
+If you don't know the answer based on the context provided, just say that you don't know - don't make up information.
+
+Context (may include documentation and/or lore):
+{context}
+
+Question: {question}
+
+Helpful Answer:"""
 
 
 # =============================================================================
@@ -221,6 +284,14 @@ TRUNCATE_MSG_CONTENT = "... (showing first {shown} chars of {total} total)"
 # =============================================================================
 LOADER_AUTODETECT_ENCODING = True
 
+# =============================================================================
+# Document Loading
+# =============================================================================
+# File reads are I/O bound, so use more threads than cores
+LOADER_MAX_CONCURRENCY = (os.cpu_count() or 1) * 4
+# Files read ahead of the ingestion pipeline at any one time
+LOADER_READ_WINDOW = LOADER_MAX_CONCURRENCY * 4
+
 # =============================================================================
 # HTML/Web Constants
 # =============================================================================
@@ -5,34 +5,57 @@ Dependency Injection Container for Godot AI Development Assistant.
 This module provides a centralized DI container that manages all application
 dependencies and their lifecycles.
 """
-from typing import Dict, Any, Callable, Optional
+import threading
+from typing import Dict, Any, Callable, Optional, Tuple
 from pathlib import Path
 
-from langchain_community.vectorstores import Chroma
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain.chains import RetrievalQA
-from langchain.prompts import PromptTemplate
-
 from config import AppConfig, load_config
+from constants import ERROR_DEPENDENCY_NOT_REGISTERED
 from project_analyzer import ProjectAnalyzer
 from console_output import ConsoleOutputManager
 from commands import CommandParser
 
 
+# Resolver kinds, in priority order (a lower kind is never replaced by a higher one)
+_SINGLETON = 0
+_LAZY_SINGLETON = 1
+_FACTORY = 2
+
+
 class DIContainer:
     """
     Dependency Injection Container that manages application dependencies.
 
-    Supports singleton and factory patterns for different dependency lifecycles.
+    Supports singleton, lazy singleton and factory patterns for different
+    dependency lifecycles.
     """
 
+    __slots__ = ("_resolvers", "_config", "_lock")
+
     def __init__(self):
-        """Initialize the DI container with empty registries."""
-        self._singletons: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable] = {}
+        """Initialize the DI container with an empty registry."""
+        # name -> (kind, instance or factory)
+        self._resolvers: Dict[str, Tuple[int, Any]] = {}
         self._config: Optional[AppConfig] = None
+        # Serializes lazy singleton creation; reentrant because factories
+        # resolve their own dependencies through the container
+        self._lock = threading.RLock()
+
+    def _register(self, name: str, kind: int, payload: Any) -> None:
+        """
+        Store a resolver unless a higher-priority one is already registered.
+
+        Singletons take priority over lazy singletons, which take priority
+        over factories, regardless of registration order.
+
+        Args:
+                name: Identifier for the dependency
+                kind: Resolver kind
+                payload: Instance (for singletons) or factory callable
+        """
+        existing = self._resolvers.get(name)
+        if existing is None or kind <= existing[0]:
+            self._resolvers[name] = (kind, payload)
 
     def register_singleton(self, name: str, instance: Any) -> None:
         """
@@ -42,7 +65,7 @@ class DIContainer:
                 name: Identifier for the dependency
                 instance: The singleton instance to register
         """
-        self._singletons[name] = instance
+        self._register(name, _SINGLETON, instance)
 
     def register_factory(self, name: str, factory: Callable) -> None:
         """
@@ -52,7 +75,20 @@ class DIContainer:
                 name: Identifier for the dependency
                 factory: Callable that creates the dependency
         """
-        self._factories[name] = factory
+        self._register(name, _FACTORY, factory)
+
+    def register_lazy_singleton(self, name: str, factory: Callable) -> None:
+        """
+        Register a factory whose result is created on first use and then reused.
+
+        A factory that returns None is not cached, so it is retried on the next
+        resolution.
+
+        Args:
+                name: Identifier for the dependency
+                factory: Callable that creates the dependency
+        """
+        self._register(name, _LAZY_SINGLETON, factory)
 
     def get(self, name: str) -> Any:
         """
@@ -67,15 +103,29 @@ class DIContainer:
         Raises:
                 KeyError: If dependency not found
         """
-        # Check singletons first
-        if name in self._singletons:
-            return self._singletons[name]
+        try:
+            kind, payload = self._resolvers[name]
+        except KeyError:
+            raise KeyError(ERROR_DEPENDENCY_NOT_REGISTERED.format(name=name)) from None
+
+        if kind == _SINGLETON:
+            return payload
+        if kind == _FACTORY:
+            return payload()
+
+        with self._lock:
+            # Another thread may have created it while this one waited
+            kind, payload = self._resolvers[name]
+            if kind == _SINGLETON:
+                return payload
 
-        # Check factories
-        if name in self._factories:
-            return self._factories[name]()
+            instance = payload()
 
-        raise KeyError(f"Dependency '{name}' not registered in container")
+            # Promote lazy singletons on first successful resolution
+            if instance is not None:
+                self._resolvers[name] = (_SINGLETON, instance)
+
+            return instance
 
     def has(self, name: str) -> bool:
         """
@@ -87,7 +137,7 @@ class DIContainer:
         Returns:
                 True if dependency exists, False otherwise
         """
-        return name in self._singletons or name in self._factories
+        return name in self._resolvers
 
     def bootstrap(self) -> None:
         """
@@ -131,50 +181,63 @@ class DIContainer:
         """Register embeddings based on configuration."""
 
         def create_embeddings():
+            # Provider libraries are imported on first use so only the
+            # selected one is loaded
             if self._config.embedding.provider == "local":
-                return HuggingFaceEmbeddings(
-                    model_name="all-MiniLM-L6-v2", model_kwargs={"device": "cpu"}
+                from cached_embeddings import load_local_embeddings
+
+                return load_local_embeddings(
+                    self._config.embedding.local_model, self._config.embedding.device
                 )
             else:
+                from langchain_openai import OpenAIEmbeddings
+
                 return OpenAIEmbeddings(openai_api_key=self._config.api.openai_key)
 
-        # Use factory since embeddings might be recreated
-        self.register_factory("embeddings", create_embeddings)
+        # Loading the embedding model is expensive, so build it once on first use
+        self.register_lazy_singleton("embeddings", create_embeddings)
 
     def _register_llm(self) -> None:
         """Register LLM based on configuration."""
 
         def create_llm():
             if self._config.api.provider == "anthropic":
+                from langchain_anthropic import ChatAnthropic
+
                 return ChatAnthropic(
                     model=self._config.llm.anthropic_model,
                     temperature=self._config.llm.temperature,
                     anthropic_api_key=self._config.api.anthropic_key,
                 )
             else:
+                from langchain_openai import ChatOpenAI
+
                 return ChatOpenAI(
                     model=self._config.llm.openai_model,
                     temperature=self._config.llm.temperature,
                     openai_api_key=self._config.api.openai_key,
                 )
 
-        self.register_factory("llm", create_llm)
+        self.register_lazy_singleton("llm", create_llm)
 
     def _register_vectorstore(self) -> None:
         """Register vector store."""
 
         def create_vectorstore():
+            from langchain_community.vectorstores import Chroma
+
             embeddings = self.get("embeddings")
             db_path = self._config.paths.db_path
 
-            if db_path.exists() and list(db_path.iterdir()):
+            # Stop at the first entry rather than listing the whole database
+            if db_path.is_dir() and next(db_path.iterdir(), None) is not None:
                 return Chroma(
                     persist_directory=str(db_path), embedding_function=embeddings
                 )
             return None
 
-        # Vectorstore is created lazily and cached
-        self.register_factory("vectorstore", create_vectorstore)
+        # Vectorstore is created lazily and cached once the database exists
+        self.register_lazy_singleton("vectorstore", create_vectorstore)
 
     def _register_assistant(self) -> None:
         """Register the main Godot AI Assistant."""
@@ -191,28 +254,33 @@ class DIContainer:
                 command_parser=self.get("command_parser"),
             )
 
-        # Assistant is a singleton
-        assistant = create_assistant()
-        self.register_singleton("assistant", assistant)
+        # Built on first use, so bootstrap() doesn't load the embedding model
+        # and LLM client before the caller has printed anything
+        self.register_lazy_singleton("assistant", create_assistant)
 
 
 # Global container instance
 _container: Optional[DIContainer] = None
+_container_lock = threading.Lock()
 
 
 def get_container() -> DIContainer:
     """
     Get the global DI container instance.
 
-    Creates and bootstraps the container on first call.
+    Creates and bootstraps the container on first call. Safe to call from
+    multiple threads; bootstrap runs only once.
 
     Returns:
             The global DIContainer instance
     """
     global _container
     if _container is None:
-        _container = DIContainer()
-        _container.bootstrap()
+        with _container_lock:
+            if _container is None:
+                container = DIContainer()
+                container.bootstrap()
+                _container = container
     return _container
 
 
@@ -220,7 +288,9 @@ def reset_container() -> None:
     """
     Reset the global container.
 
-    Useful for testing or reinitialization.
+    Useful for testing or reinitialization. The cached configuration is
+    dropped too, so the next container reads the environment again.
     """
     global _container
     _container = None
+    load_config.cache_clear()
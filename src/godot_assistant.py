@@ -3,26 +3,63 @@
 Core AI assistant for Godot development.
 Handles RAG pipeline, document ingestion, and query processing.
 """
-from typing import Optional
+import hashlib
+import json
+import math
+import os
+import shutil
+import sys
+from collections import Counter
+from typing import AbstractSet, Callable, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import Chroma
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain.chains import RetrievalQA
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
 from langchain.chains.retrieval_qa.base import BaseRetrievalQA
 from langchain.prompts import PromptTemplate
+from langchain_core.documents import Document
 
+from cached_embeddings import QueryCachedEmbeddings, load_local_embeddings
 from config import AppConfig
+from text_files import read_text_files, scan_files
 from commands import CommandParser, CommandContext, CommandError
+from semantic_cache import SemanticCache
 from constants import (
-    DEFAULT_CHUNK_SIZE,
-    DEFAULT_CHUNK_OVERLAP,
-    DEFAULT_RETRIEVAL_K,
+    DB_MANIFEST_FILE,
+    DB_STATS_FILE,
+    DOC_FILE_EXTENSIONS,
+    LORE_FILE_EXTENSIONS,
+    MAX_FILE_CONTENT_CONTEXT,
+    METADATA_SOURCE_TYPE,
+    QA_PROMPT_INPUT_VARIABLES,
+    QA_PROMPT_TEMPLATE,
+    SEARCH_TYPE_MMR,
+    SEPARATOR_LINE,
+    SOURCE_TYPE_DOCUMENTATION,
+    SOURCE_TYPE_LORE,
+    VECTORSTORE_HNSW_METADATA,
 )
 
+# Parsed once at import and shared by every QA chain
+QA_PROMPT = PromptTemplate(
+    template=QA_PROMPT_TEMPLATE, input_variables=QA_PROMPT_INPUT_VARIABLES
+)
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Cosine similarity of two vectors"""
+    dot = sum(x * y for x, y in zip(a, b))
+    norms = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norms if norms else 0.0
+
+
+def _print_token(token: str) -> None:
+    """Write a streamed answer fragment to the console immediately"""
+    sys.stdout.write(token)
+    sys.stdout.flush()
+
 
 class GodotAIAssistant:
     """AI assistant specialized in Godot game engine development"""
@@ -52,7 +89,10 @@ class GodotAIAssistant:
         self.config = config
         self.vectorstore = None
         self.qa_chain: BaseRetrievalQA | None = None
+        self.semantic_cache: Optional[SemanticCache] = None
         self.last_read_file = None  # Track last read file for context
+        # (content, chunks, chunk vectors) of the last large file asked about
+        self._file_chunks = None
 
         # Initialize command parser - use provided or create new
         self.command_parser = (
@@ -64,6 +104,9 @@ class GodotAIAssistant:
             embeddings if embeddings is not None else self._initialize_embeddings()
         )
 
+        # Repeated questions reuse their query vector instead of re-embedding
+        self.query_embeddings = QueryCachedEmbeddings(self.embeddings)
+
         # Initialize LLM - use provided or create new
         self.llm = llm if llm is not None else self._initialize_llm()
 
@@ -74,12 +117,16 @@ class GodotAIAssistant:
         Returns:
                 Initialized embeddings instance
         """
+        # Provider libraries are imported on first use so only the
+        # selected one is loaded
         if self.config.embedding.provider == "local":
             print("Using local embeddings (free, no API key needed)")
-            return HuggingFaceEmbeddings(
-                model_name="all-MiniLM-L6-v2", model_kwargs={"device": "cpu"}
+            return load_local_embeddings(
+                self.config.embedding.local_model, self.config.embedding.device
             )
         else:
+            from langchain_openai import OpenAIEmbeddings
+
             print("Using OpenAI embeddings")
             return OpenAIEmbeddings(openai_api_key=self.config.api.openai_key)
 
@@ -91,12 +138,16 @@ class GodotAIAssistant:
                 Initialized LLM instance
         """
         if self.config.api.provider == "anthropic":
+            from langchain_anthropic import ChatAnthropic
+
             return ChatAnthropic(
                 model=self.config.llm.anthropic_model,
                 temperature=self.config.llm.temperature,
                 anthropic_api_key=self.config.api.anthropic_key,
             )
         else:
+            from langchain_openai import ChatOpenAI
+
             return ChatOpenAI(
                 model=self.config.llm.openai_model,
                 temperature=self.config.llm.temperature,
@@ -105,19 +156,110 @@ class GodotAIAssistant:
 
     def load_or_create_vectorstore(self):
         """Load existing vectorstore or create new one from documents"""
-        if self.config.paths.db_path.exists() and list(
-            self.config.paths.db_path.iterdir()
-        ):
+        db_path = self.config.paths.db_path
+        # Stop at the first entry rather than listing the whole database
+        if db_path.is_dir() and next(db_path.iterdir(), None) is not None:
             print("Loading existing vector database...")
+            # Cache-backed, so files re-ingested by the sync below reuse the
+            # vectors of their unchanged chunks
             self.vectorstore = Chroma(
                 persist_directory=str(self.config.paths.db_path),
-                embedding_function=self.embeddings,
+                embedding_function=self._cached_embeddings(),
             )
-            print(f"Loaded {self.vectorstore._collection.count()} documents")
+            self._sync_changed_sources()
+            print(f"Loaded {self._stored_chunk_count()} documents")
+            self._warm_up_vectorstore()
         else:
             print("Creating new vector database from Godot documentation and lore...")
             self.ingest_documents()
 
+    def _stored_chunk_count(self) -> int:
+        """
+        Number of chunks in the vector database.
+
+        Read from the stats file written at ingestion, falling back to
+        counting the collection for databases built before it existed.
+
+        Returns:
+                Chunk count
+        """
+        stats_path = self.config.paths.db_path / DB_STATS_FILE
+        try:
+            return json.loads(stats_path.read_text())["count"]
+        except (OSError, ValueError, KeyError):
+            return self.vectorstore._collection.count()
+
+    def _warm_up_vectorstore(self):
+        """
+        Run one throwaway search against the loaded vectorstore.
+
+        Loads the embedding model and pulls the index into memory at startup,
+        so the first real question doesn't pay for it.
+        """
+        try:
+            self.vectorstore.similarity_search(
+                "warmup", k=self.config.rag.retrieval_k
+            )
+        except Exception as e:
+            print(f"⚠ Vector database warm-up failed: {e}")
+
+    def _scan_directory(
+        self, directory: Path, extensions: AbstractSet[str], source_type: str
+    ) -> Dict[str, Tuple[str, List[int]]]:
+        """
+        Find the source files in one directory.
+
+        Args:
+                directory: Directory to scan recursively
+                extensions: File extensions to include
+                source_type: Source type of the files found
+
+        Returns:
+                Path -> (source_type, [mtime_ns, size]) for each matching file
+        """
+        if not directory.exists():
+            return {}
+        return {
+            path: (source_type, [stat.st_mtime_ns, stat.st_size])
+            for path, stat in scan_files(str(directory), extensions)
+        }
+
+    def _scan_sources(self) -> Dict[str, Tuple[str, List[int]]]:
+        """
+        Find all documentation and lore files.
+
+        Returns:
+                Path -> (source_type, [mtime_ns, size]) for every source file
+        """
+        sources = self._scan_directory(
+            self.config.paths.docs_path, DOC_FILE_EXTENSIONS, SOURCE_TYPE_DOCUMENTATION
+        )
+        sources.update(
+            self._scan_directory(
+                self.config.paths.lore_path, LORE_FILE_EXTENSIONS, SOURCE_TYPE_LORE
+            )
+        )
+        return sources
+
+    def _iter_documents(
+        self, paths: List[str], sources: Dict[str, Tuple[str, List[int]]]
+    ) -> Iterator[Document]:
+        """
+        Yield one Document per file, reading files as they are needed.
+
+        Args:
+                paths: Files to load, in order
+                sources: Scan results the paths come from
+
+        Yields:
+                Documents with source path and source_type metadata
+        """
+        for path, content in read_text_files(paths):
+            yield Document(
+                page_content=content,
+                metadata={"source": path, METADATA_SOURCE_TYPE: sources[path][0]},
+            )
+
     def load_lore_documents(self):
         """
         Load lore documents from the lore directory.
@@ -131,94 +273,221 @@ class GodotAIAssistant:
 
         print(f"Loading lore documents from {self.config.paths.lore_path}...")
 
-        all_docs = []
-        patterns = ["**/*.txt", "**/*.md", "**/*.rst"]
-
-        for pattern in patterns:
-            try:
-                loader = DirectoryLoader(
-                    str(self.config.paths.lore_path),
-                    glob=pattern,
-                    loader_cls=TextLoader,
-                    loader_kwargs={"autodetect_encoding": True},
-                )
-                docs = loader.load()
-                all_docs.extend(docs)
-                if docs:
-                    print(f"  Loaded {len(docs)} {pattern} files")
-            except Exception as e:
-                print(f"  Warning loading {pattern}: {e}")
+        sources = self._scan_directory(
+            self.config.paths.lore_path, LORE_FILE_EXTENSIONS, SOURCE_TYPE_LORE
+        )
+        all_docs = list(self._iter_documents(sorted(sources), sources))
 
         if all_docs:
             print(f"✓ Total lore documents loaded: {len(all_docs)}")
-            # Add metadata to identify lore documents
-            for doc in all_docs:
-                doc.metadata["source_type"] = "lore"
         else:
             print("⚠ No lore documents found")
 
         return all_docs
 
-    def ingest_documents(self):
-        """Load and process Godot documentation AND lore into vector database"""
-        all_documents = []
+    def _cached_embeddings(self):
+        """
+        Wrap the embeddings in an on-disk cache keyed by chunk content.
 
-        # Load Godot documentation
-        if not self.config.paths.docs_path.exists():
-            self.display_manager.print_error_doc_missing(self.config.paths.docs_path)
-        else:
-            print("Loading Godot documentation...")
-            loader = DirectoryLoader(
-                str(self.config.paths.docs_path),
-                glob="**/*.rst",  # Godot docs are in reStructuredText
-                loader_cls=TextLoader,
-                loader_kwargs={"autodetect_encoding": True},
+        Chunks that were embedded by a previous build (with the same model)
+        are read from the cache instead of being embedded again.
+
+        Returns:
+                Cache-backed embeddings instance
+        """
+        # Separate namespaces keep vectors from different models apart. The
+        # model id can be a filesystem path, which isn't a valid store key.
+        model_id = getattr(self.embeddings, "model_name", None) or getattr(
+            self.embeddings, "model", type(self.embeddings).__name__
+        )
+        namespace = hashlib.sha1(str(model_id).encode()).hexdigest()
+        store = LocalFileStore(str(self.config.paths.embedding_cache_path))
+        return CacheBackedEmbeddings.from_bytes_store(
+            self.query_embeddings, store, namespace=namespace
+        )
+
+    def _add_chunks(self, chunks) -> None:
+        """
+        Embed a batch of chunks and store them, creating the database if needed.
+
+        Args:
+                chunks: Chunk documents to add
+        """
+        if self.vectorstore is None:
+            print("Creating embeddings and storing in vector database...")
+            # Batches are persisted as they are added, but the real manifest is
+            # only written once the build completes. Until then an empty one
+            # makes the next start's sync re-ingest every file, so an
+            # interrupted build is completed rather than left partial.
+            (self.config.paths.db_path / DB_MANIFEST_FILE).write_text("{}")
+            self.vectorstore = Chroma(
+                persist_directory=str(self.config.paths.db_path),
+                embedding_function=self._cached_embeddings(),
+                collection_metadata=VECTORSTORE_HNSW_METADATA,
             )
+        self.vectorstore.add_documents(chunks)
 
-            try:
-                documents = loader.load()
-                # Mark as documentation
-                for doc in documents:
-                    doc.metadata["source_type"] = "documentation"
-                all_documents.extend(documents)
-                print(f"✓ Loaded {len(documents)} documentation files")
-            except Exception as e:
-                print(f"Error loading documentation: {e}")
-
-        # Load lore documents
-        lore_documents = self.load_lore_documents()
-        all_documents.extend(lore_documents)
-
-        if not all_documents:
-            print("⚠ No documents found! The assistant will have limited capabilities.")
-            print("Add documentation to godot_docs/ and/or lore to data/lore/")
+    def _add_documents(self, documents: Iterator[Document]) -> Tuple[Counter, int]:
+        """
+        Split, embed and store documents as a stream.
+
+        Only the current batch of chunks is held in memory, whatever the size
+        of the corpus.
+
+        Args:
+                documents: Documents to add
+
+        Returns:
+                (documents added per source type, number of chunks added)
+        """
+        text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=self.config.rag.chunk_size,
+            chunk_overlap=self.config.rag.chunk_overlap,
+        )
+        batch_size = self.config.rag.embedding_batch_size
+
+        document_counts = Counter()
+        chunk_count = 0
+        pending = []
+
+        for document in documents:
+            document_counts[document.metadata[METADATA_SOURCE_TYPE]] += 1
+            pending.extend(text_splitter.split_documents([document]))
+
+            # Embed and store in fixed-size batches so each batch is a handful
+            # of provider requests and is written to the embedding cache as it
+            # completes
+            while len(pending) >= batch_size:
+                self._add_chunks(pending[:batch_size])
+                pending = pending[batch_size:]
+                chunk_count += batch_size
+                print(f"  Embedded {chunk_count} chunks")
+
+        if pending:
+            self._add_chunks(pending)
+            chunk_count += len(pending)
+
+        return document_counts, chunk_count
+
+    def _write_index_files(
+        self,
+        sources: Dict[str, Tuple[str, List[int]]],
+        chunk_count: int,
+        kept: Optional[Dict[str, List[int]]] = None,
+    ) -> None:
+        """
+        Record what the database was built from, next to the database.
+
+        Args:
+                sources: Scan results of the files now in the database
+                chunk_count: Number of chunks in the database
+                kept: Manifest entries carried over without being rescanned
+        """
+        db_path = self.config.paths.db_path
+        manifest = {path: signature for path, (_, signature) in sources.items()}
+        manifest.update(kept or {})
+        (db_path / DB_MANIFEST_FILE).write_text(json.dumps(manifest))
+        (db_path / DB_STATS_FILE).write_text(json.dumps({"count": chunk_count}))
+
+    def _sync_changed_sources(self) -> None:
+        """
+        Bring a loaded database up to date with the docs and lore on disk.
+
+        Files are compared by modification time and size against the manifest
+        written at the last ingestion. Chunks of removed or changed files are
+        deleted, and new or changed files are ingested, so edits don't require
+        a full rebuild. Files under a docs or lore directory that is missing
+        are left untouched rather than treated as removed. Chunks of files
+        missing from the manifest are deleted before they are ingested, since
+        an interrupted build or sync may already have stored some of them.
+        """
+        try:
+            manifest = json.loads(
+                (self.config.paths.db_path / DB_MANIFEST_FILE).read_text()
+            )
+        except (OSError, ValueError):
+            # Built before manifests existed; nothing to compare against
             return
 
-        print(f"\nTotal documents to process: {len(all_documents)}")
-        print(
-            f"  - Documentation: {len([d for d in all_documents if d.metadata.get('source_type') == 'documentation'])}"
+        # A missing directory (e.g. an unmounted volume) says nothing about
+        # its files, so their chunks and manifest entries are kept as they are
+        missing_prefixes = []
+        for root in (self.config.paths.docs_path, self.config.paths.lore_path):
+            if not root.exists():
+                print(f"⚠ Source directory not found, keeping its chunks: {root}")
+                missing_prefixes.append(str(root) + os.sep)
+        kept = {
+            path: signature
+            for path, signature in manifest.items()
+            if path.startswith(tuple(missing_prefixes))
+        }
+
+        sources = self._scan_sources()
+        stale = [
+            path
+            for path, signature in manifest.items()
+            if path not in kept
+            and (path not in sources or sources[path][1] != signature)
+        ]
+        fresh = sorted(
+            path
+            for path, (_, signature) in sources.items()
+            if manifest.get(path) != signature
         )
+        if not stale and not fresh:
+            return
+
         print(
-            f"  - Lore: {len([d for d in all_documents if d.metadata.get('source_type') == 'lore'])}"
+            f"Updating vector database: {len(fresh)} new or changed, "
+            f"{len(set(stale) - set(fresh))} removed files"
         )
 
-        # Split documents using configured chunk size
-        print("\nSplitting documents into chunks...")
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=DEFAULT_CHUNK_SIZE,
-            chunk_overlap=DEFAULT_CHUNK_OVERLAP,
-            length_function=len,
+        # Cached answers may depend on the changed files
+        shutil.rmtree(self.config.paths.qa_cache_path, ignore_errors=True)
+
+        self.vectorstore._collection.delete(
+            where={"source": {"$in": sorted(set(stale) | set(fresh))}}
         )
-        texts = text_splitter.split_documents(all_documents)
-        print(f"Created {len(texts)} chunks")
-
-        # Create vectorstore
-        print("Creating embeddings and storing in vector database...")
-        self.vectorstore = Chroma.from_documents(
-            documents=texts,
-            embedding=self.embeddings,
-            persist_directory=str(self.config.paths.db_path),
+        self._add_documents(self._iter_documents(fresh, sources))
+
+        self._write_index_files(
+            sources, self.vectorstore._collection.count(), kept=kept
         )
+
+    def ingest_documents(self):
+        """
+        Load and process Godot documentation AND lore into vector database.
+
+        Files are read, split and embedded as a stream rather than loaded
+        all at once.
+        """
+        # Cached answers were produced from the old database
+        shutil.rmtree(self.config.paths.qa_cache_path, ignore_errors=True)
+
+        if not self.config.paths.docs_path.exists():
+            self.display_manager.print_error_doc_missing(self.config.paths.docs_path)
+        if not self.config.paths.lore_path.exists():
+            print(f"⚠ Lore directory not found: {self.config.paths.lore_path}")
+
+        print("Loading Godot documentation and lore...")
+        sources = self._scan_sources()
+
+        self.vectorstore = None
+        document_counts, chunk_count = self._add_documents(
+            self._iter_documents(sorted(sources), sources)
+        )
+
+        if not document_counts:
+            print("⚠ No documents found! The assistant will have limited capabilities.")
+            print("Add documentation to godot_docs/ and/or lore to data/lore/")
+            return
+
+        print(f"\nTotal documents processed: {sum(document_counts.values())}")
+        print(f"  - Documentation: {document_counts[SOURCE_TYPE_DOCUMENTATION]}")
+        print(f"  - Lore: {document_counts[SOURCE_TYPE_LORE]}")
+        print(f"Created {chunk_count} chunks")
+
+        self._write_index_files(sources, chunk_count)
         print("✓ Vector database created successfully!")
 
     def setup_qa_chain(self):
@@ -228,51 +497,215 @@ class GodotAIAssistant:
                 "Vectorstore not initialized. Call load_or_create_vectorstore first."
             )
 
-        template = """You are an expert Godot game engine assistant with access to:
-1. Official Godot documentation
-2. Game/project lore and world-building documents
-3. The user's actual project files
+        # Create retrieval chain with configured search type and k value
+        self.qa_chain = RetrievalQA.from_chain_type(
+            llm=self.llm,
+            chain_type="stuff",
+            retriever=self.vectorstore.as_retriever(
+                search_type=self.config.rag.search_type,
+                search_kwargs={"k": self.config.rag.retrieval_k},
+            ),
+            chain_type_kwargs={"prompt": QA_PROMPT},
+            return_source_documents=True,
+        )
 
-IMPORTANT CAPABILITIES:
-- You can read files from the user's project by asking them to share specific file paths
-- You can see the project structure when provided
-- You have access to lore documents that describe the game's world, characters, story, and setting
-- You should provide advice tailored to their specific project when relevant
+        # A threshold of 0 turns the semantic answer cache off
+        if self.config.rag.semantic_cache_threshold > 0:
+            self.semantic_cache = SemanticCache(
+                self.config.paths.qa_cache_path,
+                self.query_embeddings,
+                self.config.rag.semantic_cache_threshold,
+            )
 
-When answering questions about lore, story, characters, or world-building:
-- Use the lore documents provided in the context
-- Be specific and reference details from the lore
-- Help maintain consistency with established lore
+    def _relevant_file_excerpt(self, content: str, question: str) -> str:
+        """
+        Pick the parts of a large file that are most relevant to a question.
 
-When answering technical Godot questions:
-- Use the Godot documentation in the context
-- Provide specific code examples using GDScript syntax
-- Reference best practices
+        The file is split and embedded once, on the first question about it;
+        later questions only embed the question.
 
-If you don't know the answer based on the context provided, just say that you don't know - don't make up information.
+        Args:
+                content: Full file content
+                question: User's question
 
-Context (may include documentation and/or lore):
-{context}
+        Returns:
+                The most similar chunks, in file order, within
+                MAX_FILE_CONTENT_CONTEXT characters
+        """
+        if self._file_chunks is None or self._file_chunks[0] is not content:
+            # Chunks larger than the budget could never be selected
+            splitter = RecursiveCharacterTextSplitter(
+                chunk_size=min(self.config.rag.chunk_size, MAX_FILE_CONTENT_CONTEXT),
+                chunk_overlap=0,
+            )
+            chunks = splitter.split_text(content)
+            vectors = self.embeddings.embed_documents(chunks)
+            self._file_chunks = (content, chunks, vectors)
+
+        _, chunks, vectors = self._file_chunks
+        query_vector = self.query_embeddings.embed_query(question)
+        ranked = sorted(
+            range(len(chunks)),
+            key=lambda i: _cosine_similarity(query_vector, vectors[i]),
+            reverse=True,
+        )
 
-Question: {question}
+        selected = []
+        budget = MAX_FILE_CONTENT_CONTEXT
+        for i in ranked:
+            if len(chunks[i]) <= budget:
+                selected.append(i)
+                budget -= len(chunks[i])
 
-Helpful Answer:"""
+        return "\n...\n".join(chunks[i] for i in sorted(selected))
 
-        QA_PROMPT = PromptTemplate(
-            template=template, input_variables=["context", "question"]
-        )
+    def enhance_with_context(self, question: str) -> str:
+        """
+        Prefix a question with the last read file, if any.
 
-        # Create retrieval chain with configured k value
-        self.qa_chain = RetrievalQA.from_chain_type(
-            llm=self.llm,
-            chain_type="stuff",
-            retriever=self.vectorstore.as_retriever(
-                search_kwargs={"k": DEFAULT_RETRIEVAL_K}
-            ),
-            chain_type_kwargs={"prompt": QA_PROMPT},
-            return_source_documents=True,
+        Files longer than MAX_FILE_CONTENT_CONTEXT are reduced to the parts
+        most relevant to the question.
+
+        Args:
+                question: User's question
+
+        Returns:
+                The question, preceded by the loaded file's path and content
+        """
+        if not self.last_read_file:
+            return question
+
+        content = self.last_read_file["content"]
+        if len(content) > MAX_FILE_CONTENT_CONTEXT:
+            content = self._relevant_file_excerpt(content, question)
+
+        return f"""I previously read the file: {self.last_read_file['path']}
+
+Here is the content of that file:
+```
+{content}
+```
+
+Now, my question is: {question}"""
+
+    def _stream_answer(
+        self, enhanced_question: str, on_token: Callable[[str], None]
+    ) -> dict:
+        """
+        Retrieve context, then stream the LLM's answer as it is generated.
+
+        Builds the same prompt as the "stuff" QA chain, but calls the LLM
+        directly so tokens can be shown before the full answer is ready.
+
+        Args:
+                enhanced_question: Question including any file context
+                on_token: Called with each answer fragment as it arrives
+
+        Returns:
+                Result with "result" and "source_documents" keys, like the QA chain
+        """
+        sources = self.qa_chain.retriever.get_relevant_documents(enhanced_question)
+        prompt = QA_PROMPT.format(
+            context="\n\n".join(doc.page_content for doc in sources),
+            question=enhanced_question,
         )
 
+        parts = []
+        for chunk in self.llm.stream(prompt):
+            on_token(chunk.content)
+            parts.append(chunk.content)
+
+        return {"result": "".join(parts), "source_documents": sources}
+
+    def answer_question(
+        self, question: str, on_token: Optional[Callable[[str], None]] = None
+    ) -> dict:
+        """
+        Answer a regular (non-command) question with the QA chain.
+
+        Plain questions are first looked up in the semantic cache, so a
+        question that means the same as an earlier one skips retrieval and
+        the LLM call.
+
+        Args:
+                question: User's question
+                on_token: Optional callback to stream the answer; receives each
+                        fragment as it arrives (a cached answer arrives whole)
+
+        Returns:
+                Chain result with "result" and "source_documents" keys;
+                "cached" is True when the answer came from the cache
+        """
+        # File context makes the prompt specific to this session, so only
+        # plain questions are cached
+        use_cache = self.semantic_cache is not None and not self.last_read_file
+
+        if use_cache:
+            cached_answer = self.semantic_cache.lookup(question)
+            if cached_answer is not None:
+                if on_token is not None:
+                    on_token(cached_answer)
+                return {
+                    "result": cached_answer,
+                    "source_documents": [],
+                    "cached": True,
+                }
+
+        enhanced_question = self.enhance_with_context(question)
+        if on_token is not None:
+            result = self._stream_answer(enhanced_question, on_token)
+        else:
+            result = self.qa_chain.invoke({"query": enhanced_question})
+
+        if use_cache:
+            self.semantic_cache.store(question, result["result"])
+
+        return result
+
+    def answer_questions(self, questions: List[str]) -> List[dict]:
+        """
+        Answer several independent questions together.
+
+        All queries are embedded in one batch and the LLM calls run
+        concurrently, so scripted runs don't wait on each question in turn.
+        Loaded file context and the semantic cache are not used.
+
+        Args:
+                questions: Questions to answer
+
+        Returns:
+                One result per question, in order, each with "result" and
+                "source_documents" keys
+
+        Raises:
+                ValueError: If QA chain not initialized
+        """
+        if not self.qa_chain:
+            raise ValueError("QA chain not initialized. Call setup_qa_chain first.")
+
+        k = self.config.rag.retrieval_k
+        if self.config.rag.search_type == SEARCH_TYPE_MMR:
+            search_by_vector = self.vectorstore.max_marginal_relevance_search_by_vector
+        else:
+            search_by_vector = self.vectorstore.similarity_search_by_vector
+
+        query_vectors = self.embeddings.embed_documents(questions)
+        all_sources = [search_by_vector(vector, k=k) for vector in query_vectors]
+
+        prompts = [
+            QA_PROMPT.format(
+                context="\n\n".join(doc.page_content for doc in sources),
+                question=question,
+            )
+            for question, sources in zip(questions, all_sources)
+        ]
+        answers = self.llm.batch(prompts)
+
+        return [
+            {"result": answer.content, "source_documents": sources}
+            for answer, sources in zip(answers, all_sources)
+        ]
+
     def ask(self, question: str) -> str:
         """
         Ask a question to the Godot AI assistant.
@@ -300,8 +733,6 @@ Helpful Answer:"""
                     assistant=self,
                 )
                 result = command.execute(context)
-                # Remove HTML tags for console output
-                result = result.replace("<pre>", "").replace("</pre>", "")
                 print(result)
                 return ""
         except CommandError as e:
@@ -309,43 +740,33 @@ Helpful Answer:"""
             return ""
 
         # Not a command - process as regular question
-        # Enhance question with file context if available
-        enhanced_question = question
-        if self.last_read_file:
-            enhanced_question = f"""I previously read the file: {self.last_read_file['path']}
-
-Here is the content of that file:
-```
-{self.last_read_file['content'][:4000]}
-```
-
-Now, my question is: {question}"""
-
-        print(f"\nQuestion: {question}")
-        print("Thinking...\n")
-
-        result = self.qa_chain.invoke({"query": enhanced_question})
+        sys.stdout.write(f"\nQuestion: {question}\nThinking...\n\nAnswer:\n")
+        sys.stdout.flush()
+        result = self.answer_question(question, on_token=_print_token)
 
         answer = result["result"]
         sources = result["source_documents"]
 
-        print("Answer:")
-        print(answer)
-        print("\n" + "=" * 80)
-
-        # Show source types
-        doc_sources = [
-            s for s in sources if s.metadata.get("source_type") == "documentation"
-        ]
-        lore_sources = [s for s in sources if s.metadata.get("source_type") == "lore"]
+        # Show source types; the footer is written in one go after the answer
+        source_counts = Counter(s.metadata.get(METADATA_SOURCE_TYPE) for s in sources)
 
-        print(f"Sources: {len(sources)} relevant chunks retrieved")
-        if doc_sources:
-            print(f"  - {len(doc_sources)} from documentation")
-        if lore_sources:
-            print(f"  - {len(lore_sources)} from lore")
+        # The leading empty lines end the streamed answer line and add a gap
+        footer = ["", "", SEPARATOR_LINE]
+        if result.get("cached"):
+            footer.append("Answered from cache of similar questions")
+        else:
+            footer.append(f"Sources: {len(sources)} relevant chunks retrieved")
+        if source_counts[SOURCE_TYPE_DOCUMENTATION]:
+            footer.append(
+                f"  - {source_counts[SOURCE_TYPE_DOCUMENTATION]} from documentation"
+            )
+        if source_counts[SOURCE_TYPE_LORE]:
+            footer.append(f"  - {source_counts[SOURCE_TYPE_LORE]} from lore")
         if self.last_read_file:
-            print(f"  - Context: {self.last_read_file['path']}")
-        print("=" * 80)
+            footer.append(f"  - Context: {self.last_read_file['path']}")
+        footer.append(SEPARATOR_LINE)
+
+        sys.stdout.write("\n".join(footer) + "\n")
+        sys.stdout.flush()
 
         return answer
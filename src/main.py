@@ -5,8 +5,18 @@ Provides interactive CLI for querying the assistant.
 
 Refactored to use dependency injection for better testability and modularity.
 """
+import argparse
+import gc
 import sys
+from pathlib import Path
 from di_container import get_container, reset_container
+from constants import EXIT_COMMANDS, SEPARATOR_LINE
+
+try:
+    # Gives input() line editing and in-session history where available
+    import readline  # noqa: F401
+except ImportError:
+    pass
 
 
 def initialize_chat(assistant, display_manager) -> None:
@@ -24,7 +34,7 @@ def initialize_chat(assistant, display_manager) -> None:
             prompt = "Your question (type 'quit' to exit): "
             question = input(prompt).strip()
 
-            if question.lower() in ["quit", "exit", "q"]:
+            if question.lower() in EXIT_COMMANDS:
                 display_manager.print_goodbye_message()
                 break
 
@@ -41,8 +51,35 @@ def initialize_chat(assistant, display_manager) -> None:
             continue
 
 
+def run_batch(assistant, batch_file: Path) -> None:
+    """
+    Answer every question in a file, one question per line.
+
+    Args:
+            assistant: Instance of the GodotAIAssistant class
+            batch_file: Text file of questions; blank lines are skipped
+    """
+    questions = [
+        line.strip()
+        for line in batch_file.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+
+    for question, result in zip(questions, assistant.answer_questions(questions)):
+        print(f"\nQuestion: {question}\n\nAnswer:\n{result['result']}")
+        print(SEPARATOR_LINE)
+
+
 def main() -> None:
     """Main entry point for the console application."""
+    arg_parser = argparse.ArgumentParser(description="Godot AI Development Assistant")
+    arg_parser.add_argument(
+        "--batch-file",
+        type=Path,
+        help="answer the questions in this file (one per line) and exit",
+    )
+    args = arg_parser.parse_args()
+
     try:
         # Get the DI container (initializes all dependencies)
         container = get_container()
@@ -51,21 +88,29 @@ def main() -> None:
         config = container.get("config")
         display_manager = container.get("output_manager")
         project_analyzer = container.get("project_analyzer")
-        assistant = container.get("assistant")
 
-        # Display startup information
+        # Display startup information before the models are loaded
         display_manager.print_title()
         config.print_summary()
         display_manager.print_project_status(project_analyzer)
 
+        assistant = container.get("assistant")
+
         # Initialize vector database
         assistant.load_or_create_vectorstore()
 
         # Setup QA chain
         assistant.setup_qa_chain()
 
-        # Start interactive chat
-        initialize_chat(assistant, display_manager)
+        # Everything built so far lives for the whole session; move it out of
+        # the collector's reach so later GC passes don't rescan it
+        gc.freeze()
+
+        if args.batch_file:
+            run_batch(assistant, args.batch_file)
+        else:
+            # Start interactive chat
+            initialize_chat(assistant, display_manager)
 
     except ValueError as e:
         print(f"❌ Configuration error: {e}")
@@ -12,6 +12,14 @@ from constants import (
     MAX_STRUCTURE_LINES,
 )
 
+# Files shown in the project structure (extension patterns without the "*")
+_STRUCTURE_FILE_SUFFIXES = (
+    GODOT_SCRIPT_EXTENSION.lstrip("*"),
+    GODOT_SCENE_EXTENSION.lstrip("*"),
+    GODOT_RESOURCE_EXTENSION.lstrip("*"),
+    GODOT_PROJECT_FILE,
+)
+
 
 class ProjectAnalyzer:
     """Analyzes and provides context about the user's Godot project"""
@@ -40,14 +48,7 @@ class ProjectAnalyzer:
 
                 subindent = " " * 2 * (level + 1)
                 for file in sorted(files)[:MAX_FILES_PER_DIRECTORY]:  # Limit files per directory
-                    if file.endswith(
-                        (
-                            GODOT_SCRIPT_EXTENSION,
-                            GODOT_SCENE_EXTENSION,
-                            GODOT_RESOURCE_EXTENSION,
-                            GODOT_PROJECT_FILE,
-                        )
-                    ):
+                    if file.endswith(_STRUCTURE_FILE_SUFFIXES):
                         structure.append(f"{subindent}{file}")
 
             return "\n".join(structure[:100])  # Limit total lines
@@ -66,6 +67,22 @@ class ProjectAnalyzer:
         except Exception as e:
             return f"Error reading file: {e}"
 
+    def read_file_head(self, relative_path, max_chars):
+        """Read at most max_chars + 1 characters from the start of a project file
+
+        The extra character lets callers detect truncation without reading
+        the whole file.
+        """
+        try:
+            file_path = self.project_path / relative_path
+            if not file_path.exists():
+                return None
+
+            with open(file_path, "r", encoding="utf-8") as f:
+                return f.read(max_chars + 1)
+        except Exception as e:
+            return f"Error reading file: {e}"
+
     def find_files(self, pattern=GODOT_SCRIPT_EXTENSION):
         """Find files matching a pattern"""
         if not self.project_exists:
@@ -79,6 +96,25 @@ class ProjectAnalyzer:
         except Exception as e:
             return []
 
+    def _count_files_by_suffix(self, suffixes):
+        """Count project files per suffix in a single walk of the tree"""
+        counts = dict.fromkeys(suffixes, 0)
+        stack = [str(self.project_path)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            suffix = os.path.splitext(entry.name)[1]
+                            if suffix in counts:
+                                counts[suffix] += 1
+            except OSError:
+                continue
+        return counts
+
     def get_project_info(self):
         """Get basic project information"""
         if not self.project_exists:
@@ -94,11 +130,12 @@ class ProjectAnalyzer:
         else:
             info.append("⚠ No project.godot found - may not be a Godot project root")
 
-        # Count files
-        gd_files = len(self.find_files("*.gd"))
-        scene_files = len(self.find_files("*.tscn"))
+        # Count scripts and scenes together rather than walking once per type
+        script_suffix = GODOT_SCRIPT_EXTENSION.lstrip("*")
+        scene_suffix = GODOT_SCENE_EXTENSION.lstrip("*")
+        counts = self._count_files_by_suffix((script_suffix, scene_suffix))
 
-        info.append(f"GDScript files: {gd_files}")
-        info.append(f"Scene files: {scene_files}")
+        info.append(f"GDScript files: {counts[script_suffix]}")
+        info.append(f"Scene files: {counts[scene_suffix]}")
 
         return "\n".join(info)
@@ -0,0 +1,63 @@
+# src/semantic_cache.py
+"""
+Semantic answer cache for the Godot AI Development Assistant.
+Reuses a previous answer when a new question means the same thing.
+"""
+from pathlib import Path
+from typing import Optional
+
+from langchain_community.vectorstores import Chroma
+
+from constants import METADATA_ANSWER, QA_CACHE_COLLECTION
+
+
+class SemanticCache:
+    """Nearest-neighbour cache of answered questions"""
+
+    def __init__(self, persist_directory: Path, embeddings, threshold: float):
+        """
+        Open (or create) the persistent question/answer collection.
+
+        Args:
+                persist_directory: Directory holding the cache collection
+                embeddings: Embeddings used to compare questions
+                threshold: Minimum cosine similarity for a cache hit
+        """
+        self.threshold = threshold
+        self._store = Chroma(
+            collection_name=QA_CACHE_COLLECTION,
+            persist_directory=str(persist_directory),
+            embedding_function=embeddings,
+            collection_metadata={"hnsw:space": "cosine"},
+        )
+
+    def lookup(self, question: str) -> Optional[str]:
+        """
+        Find the stored answer for the most similar previous question.
+
+        Args:
+                question: User's question
+
+        Returns:
+                The cached answer, or None if no previous question is similar enough
+        """
+        hits = self._store.similarity_search_with_score(question, k=1)
+        if not hits:
+            return None
+
+        document, distance = hits[0]
+        # Cosine distance is 1 - cosine similarity
+        if 1.0 - distance < self.threshold:
+            return None
+
+        return document.metadata[METADATA_ANSWER]
+
+    def store(self, question: str, answer: str) -> None:
+        """
+        Remember the answer to a question.
+
+        Args:
+                question: User's question
+                answer: Answer produced by the QA chain
+        """
+        self._store.add_texts([question], metadatas=[{METADATA_ANSWER: answer}])
@@ -0,0 +1,87 @@
+# src/text_files.py
+"""
+Discovery and reading of plain-text source files (documentation and lore).
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Iterator, List, Optional, Tuple
+
+from constants import LOADER_MAX_CONCURRENCY, LOADER_READ_WINDOW
+
+
+def scan_files(
+    directory: str, extensions: AbstractSet[str]
+) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Recursively yield files with the given extensions in a single pass.
+
+    Hidden entries (e.g. .git/, .obsidian/, .trash/) are skipped. Directories
+    and files that can't be read are skipped with a warning rather than
+    aborting the scan.
+
+    Args:
+            directory: Directory to scan
+            extensions: Lower-case extensions to include (e.g. {".md"})
+
+    Yields:
+            (path, stat result) for each matching file
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError as e:
+        print(f"  Warning scanning {directory}: {e}")
+        return
+
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from scan_files(entry.path, extensions)
+        elif os.path.splitext(entry.name)[1].lower() in extensions:
+            try:
+                stat = entry.stat()
+            except OSError as e:
+                # e.g. a broken symlink
+                print(f"  Warning scanning {entry.path}: {e}")
+                continue
+            yield entry.path, stat
+
+
+def read_text_file(path: str) -> Optional[str]:
+    """
+    Read a text file as UTF-8, replacing undecodable bytes.
+
+    Args:
+            path: File to read
+
+    Returns:
+            File content, or None if the file couldn't be read
+    """
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError as e:
+        print(f"  Warning loading {path}: {e}")
+        return None
+
+
+def read_text_files(paths: List[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Read files concurrently, yielding them in order as they become available.
+
+    Files are read a window at a time, so only a bounded number of contents
+    are held in memory however slowly the caller consumes them.
+
+    Args:
+            paths: Files to read
+
+    Yields:
+            (path, content) for each file that could be read
+    """
+    with ThreadPoolExecutor(max_workers=LOADER_MAX_CONCURRENCY) as executor:
+        for start in range(0, len(paths), LOADER_READ_WINDOW):
+            window = paths[start : start + LOADER_READ_WINDOW]
+            for path, content in zip(window, executor.map(read_text_file, window)):
+                if content is not None:
+                    yield path, content
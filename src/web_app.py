@@ -5,10 +5,13 @@ Provides HTTP API endpoints for chat functionality.
 
 Refactored to use dependency injection for better testability and modularity.
 """
+import gc
 import os
+import threading
 from pathlib import Path
 from flask import Flask, render_template, request, jsonify
 
+from config import load_config
 from di_container import get_container
 from commands import CommandContext, CommandError
 
@@ -23,27 +26,35 @@ app = Flask(__name__, template_folder=template_dir, static_folder=static_dir)
 
 # Global container (initialized on first request)
 container = None
+_container_lock = threading.Lock()
 
 
 def get_or_create_container():
     """
     Get or create the DI container.
 
-    Lazy initialization on first request.
+    Lazy initialization on first request. Concurrent first requests wait for
+    a single initialization instead of each loading the models.
 
     Returns:
             The global DIContainer instance
     """
     global container
     if container is None:
-        container = get_container()
+        with _container_lock:
+            if container is None:
+                new_container = get_container()
 
-        # Initialize assistant
-        assistant = container.get("assistant")
-        assistant.load_or_create_vectorstore()
-        assistant.setup_qa_chain()
+                # Initialize assistant
+                assistant = new_container.get("assistant")
+                assistant.load_or_create_vectorstore()
+                assistant.setup_qa_chain()
+
+                # Models and chains live for the whole process; exclude them from GC scans
+                gc.freeze()
 
-        print("✓ Assistant initialized successfully")
+                container = new_container
+                print("✓ Assistant initialized successfully")
 
     return container
 
@@ -95,7 +106,11 @@ def ask_question():
                 cmd_type = _classify_command_result(result)
 
                 return jsonify(
-                    {"answer": result, "question": question, "type": cmd_type}
+                    {
+                        "answer": command.format_for_html(result),
+                        "question": question,
+                        "type": cmd_type,
+                    }
                 )
         except CommandError as e:
             return jsonify(
@@ -107,10 +122,7 @@ def ask_question():
             )
 
         # Not a command - process as regular question
-        enhanced_question = _enhance_with_context(question, assistant)
-
-        # Query the assistant
-        result = assistant.qa_chain.invoke({"query": enhanced_question})
+        result = assistant.answer_question(question)
         answer = result["result"]
 
         return jsonify({"answer": answer, "question": question})
@@ -171,35 +183,15 @@ def _classify_command_result(result: str) -> str:
         return "success"
 
 
-def _enhance_with_context(question: str, assistant) -> str:
-    """
-    Enhance question with file context if available.
-
-    Args:
-            question: Original question
-            assistant: Assistant instance
-
-    Returns:
-            Enhanced question with file context
-    """
-    if not assistant.last_read_file:
-        return question
-
-    return f"""I previously read the file: {assistant.last_read_file['path']}
-
-Here is the content of that file:
-```
-{assistant.last_read_file['content'][:4000]}
-```
-
-Now, my question is: {question}"""
-
-
 if __name__ == "__main__":
     try:
-        # Get container and configuration
-        container = get_or_create_container()
-        config = container.get("config")
+        config = load_config()
+
+        # Warm up models, vector database and QA chain before serving. With the
+        # debug reloader this process only watches files and requests are served
+        # by a child process (WERKZEUG_RUN_MAIN set), so only warm up there.
+        if not config.web.debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+            get_or_create_container()
 
         # Run Flask app with configured settings
         app.run(host=config.web.host, port=config.web.port, debug=config.web.debug)
@@ -13,6 +13,7 @@ src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
 # Now we can import our modules
+from cached_embeddings import load_local_embeddings
 from di_container import DIContainer, reset_container
 from config import (
     AppConfig,
@@ -58,17 +59,24 @@ def mock_config(tmp_path):
 
     mock.embedding = Mock()
     mock.embedding.provider = "local"
+    mock.embedding.local_model = "all-MiniLM-L6-v2"
+    mock.embedding.device = "cpu"
 
     mock.paths = Mock()
     mock.paths.project_path = project_path
     mock.paths.docs_path = docs_path
     mock.paths.lore_path = lore_path
     mock.paths.db_path = db_path
+    mock.paths.embedding_cache_path = tmp_path / "embedding_cache"
+    mock.paths.qa_cache_path = tmp_path / "qa_cache"
 
     mock.rag = Mock()
     mock.rag.chunk_size = 1000
     mock.rag.chunk_overlap = 200
     mock.rag.retrieval_k = 6
+    mock.rag.search_type = "similarity"
+    mock.rag.embedding_batch_size = 512
+    mock.rag.semantic_cache_threshold = 0.97
 
     mock.llm = Mock()
     mock.llm.anthropic_model = "claude-sonnet-4-20250514"
@@ -245,3 +253,15 @@ def cleanup_container():
     """
     yield
     reset_container()
+
+
+@pytest.fixture(autouse=True)
+def clear_local_embeddings_cache():
+    """
+    Automatically clear the process-wide local embedding model cache.
+
+    Tests that patch HuggingFaceEmbeddings would otherwise leave the patched
+    instance cached for later tests in the same process.
+    """
+    yield
+    load_local_embeddings.cache_clear()
@@ -0,0 +1,85 @@
+# tests/test_cached_embeddings.py
+"""
+Unit tests for the query-caching embeddings wrapper.
+Run with: pytest tests/test_cached_embeddings.py -v
+"""
+import sys
+from unittest.mock import Mock, patch
+
+from cached_embeddings import QueryCachedEmbeddings, _resolve_device
+
+
+class TestResolveDevice:
+    """Tests for embedding device selection"""
+
+    def test_explicit_device_passes_through(self):
+        """Test that a configured device is used as-is"""
+        assert _resolve_device("cpu") == "cpu"
+        assert _resolve_device("mps") == "mps"
+
+    def test_auto_uses_gpu_when_available(self):
+        """Test that auto picks CUDA when torch reports a GPU"""
+        torch = Mock()
+        torch.cuda.is_available.return_value = True
+
+        with patch.dict(sys.modules, {"torch": torch}):
+            assert _resolve_device("auto") == "cuda"
+
+    def test_auto_uses_mps_without_cuda(self):
+        """Test that auto picks Apple's MPS backend when there is no CUDA GPU"""
+        torch = Mock()
+        torch.cuda.is_available.return_value = False
+        torch.backends.mps.is_available.return_value = True
+
+        with patch.dict(sys.modules, {"torch": torch}):
+            assert _resolve_device("auto") == "mps"
+
+    def test_auto_falls_back_to_cpu(self):
+        """Test that auto picks the CPU without a GPU"""
+        torch = Mock()
+        torch.cuda.is_available.return_value = False
+        torch.backends.mps.is_available.return_value = False
+
+        with patch.dict(sys.modules, {"torch": torch}):
+            assert _resolve_device("auto") == "cpu"
+
+
+class TestQueryCachedEmbeddings:
+    """Tests for QueryCachedEmbeddings"""
+
+    def test_repeated_query_embedded_once(self, mock_embeddings):
+        """Test that the same query text is only embedded once"""
+        embeddings = QueryCachedEmbeddings(mock_embeddings)
+
+        first = embeddings.embed_query("What is a Node2D?")
+        second = embeddings.embed_query("What is a Node2D?")
+
+        assert first == second == [0.1, 0.2, 0.3]
+        mock_embeddings.embed_query.assert_called_once_with("What is a Node2D?")
+
+    def test_cached_vector_is_not_shared(self, mock_embeddings):
+        """Test that callers can't modify the cached vector"""
+        embeddings = QueryCachedEmbeddings(mock_embeddings)
+
+        embeddings.embed_query("What is a Node2D?").append(1.0)
+
+        assert embeddings.embed_query("What is a Node2D?") == [0.1, 0.2, 0.3]
+
+    def test_documents_pass_through(self, mock_embeddings):
+        """Test that document embedding is delegated every time"""
+        embeddings = QueryCachedEmbeddings(mock_embeddings)
+
+        embeddings.embed_documents(["chunk"])
+        embeddings.embed_documents(["chunk"])
+
+        assert mock_embeddings.embed_documents.call_count == 2
+
+    def test_duplicate_documents_embedded_once(self, mock_embeddings):
+        """Test that identical texts in one call are embedded once"""
+        mock_embeddings.embed_documents.return_value = [[0.1], [0.2]]
+        embeddings = QueryCachedEmbeddings(mock_embeddings)
+
+        vectors = embeddings.embed_documents(["header", "body", "header"])
+
+        assert vectors == [[0.1], [0.2], [0.1]]
+        mock_embeddings.embed_documents.assert_called_once_with(["header", "body"])
@@ -20,6 +20,7 @@ from commands import (
     HelpCommand,
     FileNotFoundError,
     InvalidCommandError,
+    parse_command,
 )
 
 
@@ -68,6 +69,11 @@ class TestCommandParser:
         with pytest.raises(InvalidCommandError):
             parser.parse("/read")
 
+    def test_parse_read_file_tab_separated(self, parser):
+        cmd = parser.parse("/read\tscripts/player.gd")
+        assert isinstance(cmd, ReadFileCommand)
+        assert cmd.file_path == "scripts/player.gd"
+
     def test_parse_list_default(self, parser):
         cmd = parser.parse("/list")
         assert isinstance(cmd, ListFilesCommand)
@@ -90,6 +96,18 @@ class TestCommandParser:
         cmd = parser.parse("/project")
         assert isinstance(cmd, HelpCommand)
 
+    def test_parse_project_subcommand_case_insensitive(self, parser):
+        cmd = parser.parse("/project INFO")
+        assert isinstance(cmd, ProjectInfoCommand)
+
+    def test_parse_project_subcommand_not_substring_matched(self, parser):
+        cmd = parser.parse("/project information")
+        assert isinstance(cmd, HelpCommand)
+
+    def test_parse_command_prefix_only_matches_whole_word(self, parser):
+        with pytest.raises(InvalidCommandError):
+            parser.parse("/readme")
+
     def test_parse_not_command(self, parser):
         cmd = parser.parse("What is a Node2D?")
         assert cmd is None
@@ -101,6 +119,12 @@ class TestCommandParser:
     def test_is_command(self, parser):
         assert parser.is_command("/project info") is True
         assert parser.is_command("regular question") is False
+        assert parser.is_command("   /lore") is True
+        assert parser.is_command("") is False
+
+    def test_parse_command_convenience(self):
+        assert isinstance(parse_command("/lore"), LoreStatusCommand)
+        assert parse_command("What is a Node2D?") is None
 
 
 # Command Execution Tests
@@ -113,7 +137,8 @@ class TestProjectInfoCommand:
         result = cmd.execute(mock_context)
 
         assert "Project Info" in result
-        assert "<pre>" in result
+        assert "<pre>" not in result
+        assert cmd.format_for_html(result) == "<pre>Project Info</pre>"
         mock_context.project_analyzer.get_project_info.assert_called_once()
 
 
@@ -128,7 +153,8 @@ class TestProjectStructureCommand:
         result = cmd.execute(mock_context)
 
         assert "Project Structure" in result
-        assert "<pre>" in result
+        assert "<pre>" not in result
+        assert cmd.format_for_html(result) == "<pre>Project Structure</pre>"
         mock_context.project_analyzer.get_project_structure.assert_called_once()
 
 
@@ -150,6 +176,15 @@ class TestReadFileCommand:
         assert mock_context.assistant.last_read_file["path"] == "test.gd"
         assert mock_context.assistant.last_read_file["content"] == "file content here"
 
+    def test_read_file_html_is_escaped(self, mock_context):
+        mock_context.project_analyzer.read_file.return_value = "var a: Array[int] = []\nif a < b:"
+
+        cmd = ReadFileCommand("test.gd")
+        html = cmd.format_for_html(cmd.execute(mock_context))
+
+        assert html.startswith("<pre>")
+        assert "if a &lt; b:" in html
+
     def test_read_file_not_found(self, mock_context):
         mock_context.project_analyzer.read_file.return_value = None
 
@@ -171,6 +206,19 @@ class TestReadFileCommand:
         # Should show truncation message
         assert "showing first 3000 chars" in result
 
+    def test_read_file_without_assistant_reads_head_only(self, mock_context):
+        mock_context.assistant = None
+        mock_context.project_analyzer.read_file_head.return_value = "x" * 3001
+
+        cmd = ReadFileCommand("large.gd")
+        result = cmd.execute(mock_context)
+
+        mock_context.project_analyzer.read_file_head.assert_called_once_with(
+            "large.gd", 3000
+        )
+        mock_context.project_analyzer.read_file.assert_not_called()
+        assert "showing first 3000 chars" in result
+
 
 class TestListFilesCommand:
 
@@ -222,6 +270,7 @@ class TestClearContextCommand:
         assert "Cleared file context" in result
         assert "test.gd" in result
         assert mock_context.assistant.last_read_file is None
+        assert mock_context.assistant._file_chunks is None
 
     def test_clear_without_context(self, mock_context):
         mock_context.assistant.last_read_file = None
@@ -230,6 +279,7 @@ class TestClearContextCommand:
         result = cmd.execute(mock_context)
 
         assert "No file context to clear" in result
+        assert cmd.format_for_html(result) == result
 
 
 class TestLoreStatusCommand:
@@ -255,6 +305,23 @@ class TestLoreStatusCommand:
 
         assert "Lore Status" in result
 
+    def test_lore_files_found_recursively(self, mock_context, tmp_path):
+        lore_dir = tmp_path / "lore"
+        (lore_dir / "chapters").mkdir(parents=True)
+        (lore_dir / "story.txt").write_text("story content")
+        (lore_dir / "chapters" / "one.md").write_text("chapter one")
+        (lore_dir / "notes.json").write_text("{}")
+
+        mock_context.assistant.config.paths.lore_path = lore_dir
+
+        cmd = LoreStatusCommand()
+        result = cmd.execute(mock_context)
+
+        assert "Found 2 lore files" in result
+        assert "story.txt (13 bytes)" in result
+        assert "one.md" in result
+        assert "notes.json" not in result
+
 
 class TestHelpCommand:
 
@@ -0,0 +1,110 @@
+# tests/test_config.py
+"""
+Unit tests for application configuration.
+Run with: pytest tests/test_config.py -v
+"""
+import pytest
+
+from config import PathConfig, RAGConfig, load_config, reload_config
+from di_container import reset_container
+
+
+@pytest.fixture
+def rag_env(monkeypatch):
+    """Clear RAG environment variables so defaults apply"""
+    for name in (
+        "RAG_SEARCH_TYPE",
+        "RAG_EMBEDDING_BATCH_SIZE",
+        "RAG_SEMANTIC_CACHE_THRESHOLD",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+class TestRAGConfig:
+    """Tests for RAGConfig validation"""
+
+    def test_defaults_are_valid(self, rag_env):
+        """Test that the default RAG settings pass validation"""
+        RAGConfig.default().validate()
+
+    @pytest.mark.parametrize("batch_size", ["0", "-1"])
+    def test_rejects_non_positive_batch_size(self, rag_env, batch_size):
+        """Test that a batch size below 1 is rejected"""
+        rag_env.setenv("RAG_EMBEDDING_BATCH_SIZE", batch_size)
+
+        with pytest.raises(ValueError, match="RAG_EMBEDDING_BATCH_SIZE"):
+            RAGConfig.default().validate()
+
+    def test_rejects_unknown_search_type(self, rag_env):
+        """Test that an unsupported search type is rejected"""
+        rag_env.setenv("RAG_SEARCH_TYPE", "hybrid")
+
+        with pytest.raises(ValueError, match="RAG_SEARCH_TYPE"):
+            RAGConfig.default().validate()
+
+    def test_accepts_mmr_search_type(self, rag_env):
+        """Test that MMR search is accepted (case-insensitive)"""
+        rag_env.setenv("RAG_SEARCH_TYPE", "MMR")
+
+        RAGConfig.default().validate()
+
+    @pytest.mark.parametrize("threshold", ["-0.1", "1.5"])
+    def test_rejects_out_of_range_cache_threshold(self, rag_env, threshold):
+        """Test that a similarity threshold outside 0-1 is rejected"""
+        rag_env.setenv("RAG_SEMANTIC_CACHE_THRESHOLD", threshold)
+
+        with pytest.raises(ValueError, match="RAG_SEMANTIC_CACHE_THRESHOLD"):
+            RAGConfig.default().validate()
+
+    def test_zero_cache_threshold_disables_cache(self, rag_env):
+        """Test that 0 (cache disabled) is a valid threshold"""
+        rag_env.setenv("RAG_SEMANTIC_CACHE_THRESHOLD", "0")
+
+        RAGConfig.default().validate()
+
+
+@pytest.fixture
+def app_env(rag_env):
+    """Minimal valid environment, without creating the /app directories"""
+    rag_env.setenv("API_PROVIDER", "anthropic")
+    rag_env.setenv("ANTHROPIC_API_KEY", "test_key")
+    rag_env.setenv("EMBEDDING_PROVIDER", "local")
+    rag_env.delenv("RAG_RETRIEVAL_K", raising=False)
+    rag_env.setattr(PathConfig, "ensure_directories", lambda self: None)
+    load_config.cache_clear()
+    yield rag_env
+    load_config.cache_clear()
+
+
+class TestLoadConfig:
+    """Tests for the cached configuration loader"""
+
+    def test_config_is_cached(self, app_env):
+        """Test that the environment is only read once"""
+        first = load_config()
+        app_env.setenv("RAG_RETRIEVAL_K", "3")
+
+        assert load_config() is first
+        assert load_config().rag.retrieval_k == 6
+
+    def test_reload_reads_environment_again(self, app_env):
+        """Test that reload_config picks up changed environment variables"""
+        first = load_config()
+        app_env.setenv("RAG_RETRIEVAL_K", "3")
+
+        reloaded = reload_config()
+
+        assert reloaded is not first
+        assert reloaded.rag.retrieval_k == 3
+        assert load_config() is reloaded
+
+    def test_reset_container_drops_cached_config(self, app_env):
+        """Test that a reset container reads the environment again"""
+        first = load_config()
+        app_env.setenv("RAG_RETRIEVAL_K", "3")
+
+        reset_container()
+
+        assert load_config() is not first
+        assert load_config().rag.retrieval_k == 3
@@ -3,6 +3,8 @@
 Unit tests for the dependency injection container.
 Run with: pytest tests/test_di_container.py -v
 """
+import threading
+import time
 import pytest
 from unittest.mock import Mock, patch
 
@@ -37,6 +39,74 @@ class TestDIContainer:
         obj2 = container.get("test")
         assert obj1 is not obj2
 
+    def test_register_lazy_singleton(self):
+        """Test that a lazy singleton is created once on first use"""
+        container = DIContainer()
+        factory = Mock(side_effect=lambda: Mock())
+
+        container.register_lazy_singleton("test", factory)
+
+        assert container.has("test")
+        factory.assert_not_called()
+
+        obj1 = container.get("test")
+        obj2 = container.get("test")
+        assert obj1 is obj2
+        factory.assert_called_once()
+
+    def test_lazy_singleton_none_is_not_cached(self):
+        """Test that a lazy singleton returning None is retried"""
+        container = DIContainer()
+        factory = Mock(side_effect=[None, "created"])
+
+        container.register_lazy_singleton("test", factory)
+
+        assert container.get("test") is None
+        assert container.get("test") == "created"
+        assert container.get("test") == "created"
+        assert factory.call_count == 2
+
+    def test_lazy_singleton_created_once_across_threads(self):
+        """Test that concurrent first uses share one lazy singleton"""
+        container = DIContainer()
+        started = threading.Event()
+        release = threading.Event()
+
+        def create():
+            started.set()
+            release.wait(timeout=5)
+            return Mock()
+
+        factory = Mock(side_effect=create)
+        container.register_lazy_singleton("test", factory)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(container.get("test")))
+            for _ in range(2)
+        ]
+
+        threads[0].start()
+        started.wait(timeout=5)
+        threads[1].start()
+        # Give the second thread time to reach the factory if it isn't locked out
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        factory.assert_called_once()
+        assert len(results) == 2 and results[0] is results[1]
+
+    def test_lazy_singleton_factory_can_resolve_lazy_dependencies(self):
+        """Test that a lazy factory may resolve another lazy singleton"""
+        container = DIContainer()
+        container.register_lazy_singleton("inner", lambda: "inner")
+        container.register_lazy_singleton(
+            "outer", lambda: f"outer({container.get('inner')})"
+        )
+
+        assert container.get("outer") == "outer(inner)"
+
     def test_get_nonexistent_dependency(self):
         """Test getting a dependency that doesn't exist"""
         container = DIContainer()
@@ -66,6 +136,16 @@ class TestDIContainer:
         # Should return singleton, not factory result
         assert container.get("test") is singleton
 
+    def test_singleton_not_replaced_by_later_factory(self):
+        """Test that registering a factory doesn't override a singleton"""
+        container = DIContainer()
+        singleton = Mock()
+
+        container.register_singleton("test", singleton)
+        container.register_factory("test", lambda: Mock())
+
+        assert container.get("test") is singleton
+
 
 class TestContainerBootstrap:
     """Tests for container bootstrapping"""
@@ -74,10 +154,10 @@ class TestContainerBootstrap:
     @patch("di_container.ConsoleOutputManager")
     @patch("di_container.ProjectAnalyzer")
     @patch("di_container.CommandParser")
-    @patch("di_container.HuggingFaceEmbeddings")
-    @patch("di_container.OpenAIEmbeddings")
-    @patch("di_container.ChatAnthropic")
-    @patch("di_container.ChatOpenAI")
+    @patch("langchain_community.embeddings.HuggingFaceEmbeddings")
+    @patch("langchain_openai.OpenAIEmbeddings")
+    @patch("langchain_anthropic.ChatAnthropic")
+    @patch("langchain_openai.ChatOpenAI")
     def test_bootstrap_registers_all_dependencies(
         self,
         mock_openai_llm,
@@ -114,8 +194,8 @@ class TestContainerBootstrap:
         assert container.has("assistant")
 
     @patch("di_container.load_config")
-    @patch("di_container.HuggingFaceEmbeddings")
-    @patch("di_container.ChatAnthropic")
+    @patch("langchain_community.embeddings.HuggingFaceEmbeddings")
+    @patch("langchain_anthropic.ChatAnthropic")
     def test_bootstrap_config_validation(self, mock_llm, mock_embed, mock_load_config):
         """Test that bootstrap validates configuration"""
         mock_config = Mock()
@@ -134,6 +214,34 @@ class TestContainerBootstrap:
         config = container.get("config")
         assert config is mock_config
 
+    @patch("di_container.load_config")
+    @patch("langchain_community.embeddings.HuggingFaceEmbeddings")
+    @patch("langchain_anthropic.ChatAnthropic")
+    def test_bootstrap_defers_models_until_assistant_is_used(
+        self, mock_llm, mock_embed, mock_load_config
+    ):
+        """Test that models are only loaded when the assistant is first resolved"""
+        mock_config = Mock()
+        mock_config.language = "en"
+        mock_config.paths.project_path = "/test/path"
+        mock_config.embedding.provider = "local"
+        mock_config.embedding.local_model = "bootstrap-test-model"
+        mock_config.embedding.device = "cpu"
+        mock_config.api.provider = "anthropic"
+        mock_load_config.return_value = mock_config
+
+        container = DIContainer()
+        container.bootstrap()
+
+        mock_embed.assert_not_called()
+        mock_llm.assert_not_called()
+
+        assistant = container.get("assistant")
+
+        mock_embed.assert_called_once()
+        mock_llm.assert_called_once()
+        assert container.get("assistant") is assistant
+
 
 class TestGlobalContainer:
     """Tests for global container functions"""
@@ -157,6 +265,32 @@ class TestGlobalContainer:
         assert mock_container_class.call_count == 1
         mock_instance.bootstrap.assert_called_once()
 
+    @patch("di_container.DIContainer")
+    def test_get_container_bootstraps_once_across_threads(self, mock_container_class):
+        """Test that concurrent first calls bootstrap a single container"""
+        import threading
+        import time
+
+        reset_container()
+
+        mock_instance = Mock()
+        mock_instance.bootstrap.side_effect = lambda: time.sleep(0.05)
+        mock_container_class.return_value = mock_instance
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_container()))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_container_class.call_count == 1
+        mock_instance.bootstrap.assert_called_once()
+        assert all(result is mock_instance for result in results)
+
     def test_reset_container(self):
         """Test that reset_container clears the global instance"""
         # Just test that reset doesn't raise an error
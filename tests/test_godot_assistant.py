@@ -0,0 +1,346 @@
+# tests/test_godot_assistant.py
+"""
+Unit tests for GodotAIAssistant ingestion and question answering.
+Run with: pytest tests/test_godot_assistant.py -v
+"""
+import json
+import shutil
+import pytest
+from unittest.mock import Mock, patch
+
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain_core.documents import Document
+
+
+def _added_sources(vectorstore):
+    """Sources of every chunk passed to vectorstore.add_documents"""
+    return sorted(
+        {
+            chunk.metadata["source"]
+            for call in vectorstore.add_documents.call_args_list
+            for chunk in call.args[0]
+        }
+    )
+
+
+def _read_manifest(config):
+    """Load the ingest manifest written next to the database"""
+    return json.loads((config.paths.db_path / "ingest_manifest.json").read_text())
+
+
+@pytest.fixture
+def synced_assistant(assistant_with_mocks, mock_config):
+    """Assistant whose database was built from two docs and one lore file"""
+    docs_path = mock_config.paths.docs_path
+    (docs_path / "nodes.rst").write_text("Nodes are the building blocks.")
+    (docs_path / "signals.rst").write_text("Signals notify other nodes.")
+    (mock_config.paths.lore_path / "world.md").write_text("The world is round.")
+
+    assistant_with_mocks._write_index_files(assistant_with_mocks._scan_sources(), 3)
+    assistant_with_mocks.vectorstore = Mock()
+    assistant_with_mocks.vectorstore._collection.count.return_value = 3
+    return assistant_with_mocks
+
+
+class TestLoadOrCreateVectorstore:
+    """Tests for opening an existing vectorstore"""
+
+    @patch("godot_assistant.Chroma")
+    def test_load_uses_cache_backed_embeddings(
+        self, mock_chroma_class, assistant_with_mocks, mock_config
+    ):
+        """Test that re-ingested chunks can come from the embedding cache"""
+        (mock_config.paths.db_path / "chroma.sqlite3").write_text("")
+        mock_chroma_class.return_value._collection.count.return_value = 0
+
+        assistant_with_mocks.load_or_create_vectorstore()
+
+        embedding_function = mock_chroma_class.call_args.kwargs["embedding_function"]
+        assert isinstance(embedding_function, CacheBackedEmbeddings)
+
+
+class TestCachedEmbeddings:
+    """Tests for the on-disk embedding cache"""
+
+    @pytest.mark.parametrize("model_name", ["/models/all-MiniLM-L6-v2", "C:\\m"])
+    def test_path_model_name(self, assistant_with_mocks, mock_embeddings, model_name):
+        """Test that a model given as a filesystem path can be cached"""
+        mock_embeddings.model_name = model_name
+
+        vectors = assistant_with_mocks._cached_embeddings().embed_documents(["Nodes"])
+
+        assert vectors == [[0.1, 0.2, 0.3]]
+        cache_path = assistant_with_mocks.config.paths.embedding_cache_path
+        assert any(cache_path.iterdir())
+
+
+class TestSyncChangedSources:
+    """Tests for incremental updates of a loaded database"""
+
+    def test_unchanged_sources(self, synced_assistant):
+        """Test that nothing is deleted or embedded when no file changed"""
+        synced_assistant._sync_changed_sources()
+
+        synced_assistant.vectorstore._collection.delete.assert_not_called()
+        synced_assistant.vectorstore.add_documents.assert_not_called()
+
+    def test_added_file(self, synced_assistant, mock_config):
+        """Test that only a new file is embedded, replacing any partial chunks"""
+        new_file = mock_config.paths.lore_path / "heroes.md"
+        new_file.write_text("The hero is brave.")
+
+        synced_assistant._sync_changed_sources()
+
+        synced_assistant.vectorstore._collection.delete.assert_called_once_with(
+            where={"source": {"$in": [str(new_file)]}}
+        )
+        assert _added_sources(synced_assistant.vectorstore) == [str(new_file)]
+        assert str(new_file) in _read_manifest(mock_config)
+
+    def test_changed_file(self, synced_assistant, mock_config):
+        """Test that a changed file's chunks are replaced"""
+        changed = mock_config.paths.docs_path / "nodes.rst"
+        changed.write_text("Nodes are the building blocks of every scene.")
+
+        synced_assistant._sync_changed_sources()
+
+        synced_assistant.vectorstore._collection.delete.assert_called_once_with(
+            where={"source": {"$in": [str(changed)]}}
+        )
+        assert _added_sources(synced_assistant.vectorstore) == [str(changed)]
+
+    def test_removed_file(self, synced_assistant, mock_config):
+        """Test that a removed file's chunks are deleted"""
+        removed = mock_config.paths.docs_path / "signals.rst"
+        removed.unlink()
+
+        synced_assistant._sync_changed_sources()
+
+        synced_assistant.vectorstore._collection.delete.assert_called_once_with(
+            where={"source": {"$in": [str(removed)]}}
+        )
+        synced_assistant.vectorstore.add_documents.assert_not_called()
+        assert str(removed) not in _read_manifest(mock_config)
+
+    def test_missing_root_keeps_its_chunks(self, synced_assistant, mock_config):
+        """Test that an unmounted docs directory doesn't wipe its chunks"""
+        docs_manifest = {
+            path: signature
+            for path, signature in _read_manifest(mock_config).items()
+            if path.endswith(".rst")
+        }
+        shutil.rmtree(mock_config.paths.docs_path)
+        new_file = mock_config.paths.lore_path / "heroes.md"
+        new_file.write_text("The hero is brave.")
+
+        synced_assistant._sync_changed_sources()
+
+        synced_assistant.vectorstore._collection.delete.assert_called_once_with(
+            where={"source": {"$in": [str(new_file)]}}
+        )
+        assert _added_sources(synced_assistant.vectorstore) == [str(new_file)]
+        manifest = _read_manifest(mock_config)
+        assert docs_manifest.items() <= manifest.items()
+        assert str(new_file) in manifest
+
+    def test_interrupted_build_is_completed(self, synced_assistant, mock_config):
+        """Test that the empty manifest of an interrupted build re-ingests all"""
+        (mock_config.paths.db_path / "ingest_manifest.json").write_text("{}")
+        sources = sorted(synced_assistant._scan_sources())
+
+        synced_assistant._sync_changed_sources()
+
+        synced_assistant.vectorstore._collection.delete.assert_called_once_with(
+            where={"source": {"$in": sources}}
+        )
+        assert _added_sources(synced_assistant.vectorstore) == sources
+        assert sorted(_read_manifest(mock_config)) == sources
+
+    def test_without_manifest(self, assistant_with_mocks):
+        """Test that databases built before manifests are left alone"""
+        assistant_with_mocks.vectorstore = Mock()
+
+        assistant_with_mocks._sync_changed_sources()
+
+        assistant_with_mocks.vectorstore._collection.delete.assert_not_called()
+        assistant_with_mocks.vectorstore.add_documents.assert_not_called()
+
+
+class TestAddDocuments:
+    """Tests for streaming documents into the vectorstore"""
+
+    @patch("godot_assistant.Chroma")
+    def test_new_database_marked_incomplete(
+        self, mock_chroma_class, assistant_with_mocks, mock_config
+    ):
+        """Test that an empty manifest is written before the first batch"""
+        manifest_path = mock_config.paths.db_path / "ingest_manifest.json"
+        manifests_seen = []
+        mock_chroma_class.return_value.add_documents.side_effect = (
+            lambda chunks: manifests_seen.append(manifest_path.read_text())
+        )
+        document = Document(
+            page_content="Lore entry",
+            metadata={"source": "0.md", "source_type": "lore"},
+        )
+
+        assistant_with_mocks._add_documents(iter([document]))
+
+        assert manifests_seen == ["{}"]
+
+    def test_chunks_added_in_batches(self, assistant_with_mocks, mock_config):
+        """Test that chunks are embedded in batches of the configured size"""
+        mock_config.rag.embedding_batch_size = 2
+        assistant_with_mocks.vectorstore = Mock()
+        documents = [
+            Document(
+                page_content=f"Lore entry {i}",
+                metadata={"source": f"{i}.md", "source_type": "lore"},
+            )
+            for i in range(5)
+        ]
+
+        counts, chunk_count = assistant_with_mocks._add_documents(iter(documents))
+
+        assert counts["lore"] == 5
+        assert chunk_count == 5
+        batch_sizes = [
+            len(call.args[0])
+            for call in assistant_with_mocks.vectorstore.add_documents.call_args_list
+        ]
+        assert batch_sizes == [2, 2, 1]
+
+
+class TestAnswerQuestion:
+    """Tests for answering regular questions"""
+
+    def test_stream_answer(self, assistant_with_mocks):
+        """Test that answer fragments are passed on as they arrive"""
+        source = Document(page_content="Node2D is the base 2D node.")
+        assistant_with_mocks.qa_chain = Mock()
+        retriever = assistant_with_mocks.qa_chain.retriever
+        retriever.get_relevant_documents.return_value = [source]
+        assistant_with_mocks.llm.stream = Mock(
+            return_value=[Mock(content="A 2D "), Mock(content="node")]
+        )
+        tokens = []
+
+        result = assistant_with_mocks._stream_answer("What is a Node2D?", tokens.append)
+
+        assert tokens == ["A 2D ", "node"]
+        assert result == {"result": "A 2D node", "source_documents": [source]}
+        prompt = assistant_with_mocks.llm.stream.call_args.args[0]
+        assert "Node2D is the base 2D node." in prompt
+        assert "What is a Node2D?" in prompt
+
+    def test_cache_hit_skips_chain(self, assistant_with_mocks):
+        """Test that a cached answer is returned without calling the chain"""
+        assistant_with_mocks.qa_chain = Mock()
+        assistant_with_mocks.semantic_cache = Mock()
+        assistant_with_mocks.semantic_cache.lookup.return_value = "A node"
+
+        result = assistant_with_mocks.answer_question("What is a Node2D?")
+
+        assert result == {"result": "A node", "source_documents": [], "cached": True}
+        assistant_with_mocks.qa_chain.invoke.assert_not_called()
+
+    def test_cache_miss_stores_answer(self, assistant_with_mocks):
+        """Test that a fresh answer is stored in the cache"""
+        assistant_with_mocks.qa_chain = Mock()
+        assistant_with_mocks.qa_chain.invoke.return_value = {
+            "result": "A node",
+            "source_documents": [],
+        }
+        assistant_with_mocks.semantic_cache = Mock()
+        assistant_with_mocks.semantic_cache.lookup.return_value = None
+
+        assistant_with_mocks.answer_question("What is a Node2D?")
+
+        assistant_with_mocks.semantic_cache.store.assert_called_once_with(
+            "What is a Node2D?", "A node"
+        )
+
+    def test_file_context_bypasses_cache(self, assistant_with_mocks):
+        """Test that questions about a loaded file are never cached"""
+        assistant_with_mocks.qa_chain = Mock()
+        assistant_with_mocks.qa_chain.invoke.return_value = {
+            "result": "Use move_and_slide",
+            "source_documents": [],
+        }
+        assistant_with_mocks.semantic_cache = Mock()
+        assistant_with_mocks.last_read_file = {
+            "path": "player.gd",
+            "content": "extends CharacterBody2D",
+        }
+
+        assistant_with_mocks.answer_question("How do I move?")
+
+        assistant_with_mocks.semantic_cache.lookup.assert_not_called()
+        assistant_with_mocks.semantic_cache.store.assert_not_called()
+        query = assistant_with_mocks.qa_chain.invoke.call_args.args[0]["query"]
+        assert "extends CharacterBody2D" in query
+
+
+class TestRelevantFileExcerpt:
+    """Tests for reducing large loaded files to relevant chunks"""
+
+    def test_chunk_size_above_budget(self, assistant_with_mocks, mock_embeddings):
+        """Test that a chunk size larger than the budget still yields content"""
+        assistant_with_mocks.config.rag.chunk_size = 8000
+        mock_embeddings.embed_documents.side_effect = lambda texts: [
+            [0.1, 0.2, 0.3] for _ in texts
+        ]
+        # Two chunks of ~8000 characters at that chunk size
+        content = " ".join(["signal"] * 2285)
+
+        excerpt = assistant_with_mocks._relevant_file_excerpt(content, "signal?")
+
+        parts = excerpt.split("\n...\n")
+        assert excerpt
+        assert sum(len(part) for part in parts) <= 4000
+        assert all(part in content for part in parts)
+
+
+class TestAnswerQuestions:
+    """Tests for batch question answering"""
+
+    def test_batch(self, assistant_with_mocks, mock_embeddings):
+        """Test that queries are embedded together and answered in order"""
+        mock_embeddings.embed_documents.return_value = [[0.1], [0.2]]
+        source = Document(page_content="Signals notify other nodes.")
+        vectorstore = Mock()
+        vectorstore.similarity_search_by_vector.return_value = [source]
+        assistant_with_mocks.qa_chain = Mock()
+        assistant_with_mocks.vectorstore = vectorstore
+        assistant_with_mocks.llm.batch = Mock(
+            return_value=[Mock(content="First"), Mock(content="Second")]
+        )
+
+        results = assistant_with_mocks.answer_questions(["Q1?", "Q2?"])
+
+        mock_embeddings.embed_documents.assert_called_once_with(["Q1?", "Q2?"])
+        vectorstore.similarity_search_by_vector.assert_any_call([0.2], k=6)
+        prompts = assistant_with_mocks.llm.batch.call_args.args[0]
+        assert len(prompts) == 2
+        assert "Q1?" in prompts[0] and "Signals notify" in prompts[0]
+        assert [r["result"] for r in results] == ["First", "Second"]
+        assert results[0]["source_documents"] == [source]
+
+    def test_batch_mmr(self, assistant_with_mocks, mock_config):
+        """Test that MMR search is used when configured"""
+        mock_config.rag.search_type = "mmr"
+        vectorstore = Mock()
+        vectorstore.max_marginal_relevance_search_by_vector.return_value = []
+        assistant_with_mocks.qa_chain = Mock()
+        assistant_with_mocks.vectorstore = vectorstore
+        assistant_with_mocks.llm.batch = Mock(return_value=[Mock(content="Answer")])
+
+        assistant_with_mocks.answer_questions(["Q1?"])
+
+        vectorstore.max_marginal_relevance_search_by_vector.assert_called_once()
+        vectorstore.similarity_search_by_vector.assert_not_called()
+
+    def test_batch_without_qa_chain(self, assistant_with_mocks):
+        """Test that batch answering requires the QA chain"""
+        with pytest.raises(ValueError, match="QA chain not initialized"):
+            assistant_with_mocks.answer_questions(["Q1?"])
@@ -0,0 +1,104 @@
+# tests/test_project_analyzer.py
+"""
+Unit tests for ProjectAnalyzer.
+Run with: pytest tests/test_project_analyzer.py -v
+"""
+import pytest
+
+from project_analyzer import ProjectAnalyzer
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    """Create a small Godot project layout"""
+    project = tmp_path / "project"
+    (project / "scripts").mkdir(parents=True)
+    (project / "scenes").mkdir()
+    (project / "project.godot").write_text("[application]")
+    (project / "scripts" / "player.gd").write_text("extends Node2D")
+    (project / "scenes" / "main.tscn").write_text("[gd_scene]")
+    return project
+
+
+class TestProjectInfo:
+    """Tests for project information"""
+
+    def test_project_info_counts_files(self, project_dir):
+        """Test that project info reports file counts"""
+        analyzer = ProjectAnalyzer(project_dir)
+
+        info = analyzer.get_project_info()
+
+        assert "Valid Godot project detected" in info
+        assert "GDScript files: 1" in info
+        assert "Scene files: 1" in info
+
+    def test_project_info_counts_beyond_list_limit(self, project_dir):
+        """Test that counts aren't capped at the /list display limit"""
+        for i in range(60):
+            (project_dir / "scripts" / f"script_{i}.gd").write_text("extends Node")
+        analyzer = ProjectAnalyzer(project_dir)
+
+        assert "GDScript files: 61" in analyzer.get_project_info()
+
+    def test_project_info_missing_project(self, tmp_path):
+        """Test project info when no project is mounted"""
+        analyzer = ProjectAnalyzer(tmp_path / "missing")
+
+        assert analyzer.get_project_info() == "No Godot project is currently mounted."
+
+    def test_project_info_refreshes_after_nested_change(self, project_dir):
+        """Test that info reflects files added to a subdirectory"""
+        analyzer = ProjectAnalyzer(project_dir)
+        assert "GDScript files: 1" in analyzer.get_project_info()
+
+        (project_dir / "scripts" / "enemy.gd").write_text("extends Node2D")
+
+        assert "GDScript files: 2" in analyzer.get_project_info()
+
+
+class TestProjectStructure:
+    """Tests for project structure"""
+
+    def test_structure_lists_directories(self, project_dir):
+        """Test that the structure includes project directories"""
+        analyzer = ProjectAnalyzer(project_dir)
+
+        structure = analyzer.get_project_structure()
+
+        assert "project.godot" in structure
+        assert "scripts/" in structure
+        assert "scenes/" in structure
+
+    def test_structure_lists_godot_files(self, project_dir):
+        """Test that scripts and scenes are shown, not just project.godot"""
+        (project_dir / "scripts" / "notes.txt").write_text("todo")
+        analyzer = ProjectAnalyzer(project_dir)
+
+        structure = analyzer.get_project_structure()
+
+        assert "player.gd" in structure
+        assert "main.tscn" in structure
+        assert "notes.txt" not in structure
+
+
+class TestReadFile:
+    """Tests for reading project files"""
+
+    def test_read_file(self, project_dir):
+        """Test reading a whole file"""
+        analyzer = ProjectAnalyzer(project_dir)
+
+        assert analyzer.read_file("scripts/player.gd") == "extends Node2D"
+
+    def test_read_missing_file(self, project_dir):
+        """Test reading a file that doesn't exist"""
+        analyzer = ProjectAnalyzer(project_dir)
+
+        assert analyzer.read_file("missing.gd") is None
+
+    def test_read_file_head(self, project_dir):
+        """Test that only the requested head (plus one char) is read"""
+        analyzer = ProjectAnalyzer(project_dir)
+
+        assert analyzer.read_file_head("scripts/player.gd", 5) == "extend"
@@ -0,0 +1,60 @@
+# tests/test_semantic_cache.py
+"""
+Unit tests for the semantic answer cache.
+Run with: pytest tests/test_semantic_cache.py -v
+"""
+import pytest
+from unittest.mock import patch
+
+from langchain_core.documents import Document
+
+from semantic_cache import SemanticCache
+
+
+def _hit(distance):
+    """Build a single search result at the given cosine distance"""
+    question = Document(page_content="What is a Node2D?", metadata={"answer": "A node"})
+    return [(question, distance)]
+
+
+@pytest.fixture
+def store():
+    """Patch the Chroma collection behind the cache"""
+    with patch("semantic_cache.Chroma") as chroma_class:
+        yield chroma_class.return_value
+
+
+@pytest.fixture
+def cache(store, tmp_path, mock_embeddings):
+    """Create a SemanticCache with a 0.97 similarity threshold"""
+    return SemanticCache(tmp_path / "qa_cache", mock_embeddings, 0.97)
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache"""
+
+    def test_lookup_hit(self, cache, store):
+        """Test that a close enough question returns the stored answer"""
+        store.similarity_search_with_score.return_value = _hit(0.01)
+
+        assert cache.lookup("What's a Node2D?") == "A node"
+
+    def test_lookup_below_threshold(self, cache, store):
+        """Test that a dissimilar question is a miss"""
+        store.similarity_search_with_score.return_value = _hit(0.2)
+
+        assert cache.lookup("How do signals work?") is None
+
+    def test_lookup_empty(self, cache, store):
+        """Test lookup on an empty cache"""
+        store.similarity_search_with_score.return_value = []
+
+        assert cache.lookup("What is a Node2D?") is None
+
+    def test_store(self, cache, store):
+        """Test that answers are stored as metadata of the question"""
+        cache.store("What is a Node2D?", "A node")
+
+        store.add_texts.assert_called_once_with(
+            ["What is a Node2D?"], metadatas=[{"answer": "A node"}]
+        )
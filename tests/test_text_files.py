@@ -0,0 +1,99 @@
+# tests/test_text_files.py
+"""
+Unit tests for text file discovery and reading.
+Run with: pytest tests/test_text_files.py -v
+"""
+import os
+from unittest.mock import patch
+
+from text_files import read_text_files, scan_files
+
+
+class TestScanFiles:
+    """Tests for scan_files"""
+
+    def test_scan_is_recursive_and_filters_extensions(self, tmp_path):
+        """Test that nested files are found and other extensions ignored"""
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "a.md").write_text("a")
+        (tmp_path / "nested" / "b.RST").write_text("bb")
+        (tmp_path / "c.json").write_text("{}")
+
+        found = sorted(
+            (path, stat.st_size)
+            for path, stat in scan_files(str(tmp_path), {".md", ".rst"})
+        )
+
+        assert found == [
+            (str(tmp_path / "a.md"), 1),
+            (str(tmp_path / "nested" / "b.RST"), 2),
+        ]
+
+    def test_hidden_entries_are_skipped(self, tmp_path):
+        """Test that hidden directories and files are not scanned"""
+        (tmp_path / ".trash").mkdir()
+        (tmp_path / ".trash" / "old.md").write_text("old")
+        (tmp_path / ".draft.md").write_text("draft")
+        (tmp_path / "a.md").write_text("a")
+
+        found = [path for path, _ in scan_files(str(tmp_path), {".md"})]
+
+        assert found == [str(tmp_path / "a.md")]
+
+    def test_unreadable_directory_is_skipped(self, tmp_path):
+        """Test that one unreadable subdirectory doesn't abort the scan"""
+        (tmp_path / "locked").mkdir()
+        (tmp_path / "locked" / "secret.md").write_text("s")
+        (tmp_path / "a.md").write_text("a")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if path == str(tmp_path / "locked"):
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        with patch("text_files.os.scandir", side_effect=scandir):
+            found = [path for path, _ in scan_files(str(tmp_path), {".md"})]
+
+        assert found == [str(tmp_path / "a.md")]
+
+    def test_broken_symlink_is_skipped(self, tmp_path):
+        """Test that a dangling link to a matching file is ignored"""
+        (tmp_path / "a.md").write_text("a")
+        os.symlink(tmp_path / "missing.md", tmp_path / "link.md")
+
+        found = [path for path, _ in scan_files(str(tmp_path), {".md"})]
+
+        assert found == [str(tmp_path / "a.md")]
+
+
+class TestReadTextFiles:
+    """Tests for read_text_files"""
+
+    def test_files_yielded_in_order(self, tmp_path):
+        """Test that concurrent reads come back in the requested order"""
+        paths = []
+        for i in range(100):
+            path = tmp_path / f"{i}.txt"
+            path.write_text(f"file {i}")
+            paths.append(str(path))
+
+        contents = [content for _, content in read_text_files(paths)]
+
+        assert contents == [f"file {i}" for i in range(100)]
+
+    def test_invalid_utf8_is_replaced(self, tmp_path):
+        """Test that undecodable bytes don't prevent a file from loading"""
+        path = tmp_path / "latin1.txt"
+        path.write_bytes(b"caf\xe9")
+
+        assert list(read_text_files([str(path)])) == [(str(path), "caf�")]
+
+    def test_unreadable_file_skipped(self, tmp_path):
+        """Test that a missing file is skipped"""
+        good = tmp_path / "good.txt"
+        good.write_text("ok")
+
+        result = list(read_text_files([str(tmp_path / "missing.txt"), str(good)]))
+
+        assert result == [(str(good), "ok")]